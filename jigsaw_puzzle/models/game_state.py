@@ -1,6 +1,6 @@
 """GameState model managing the current state of the jigsaw puzzle game"""
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from jigsaw_puzzle.models.jigsaw_piece import JigsawPiece
 
 
@@ -23,6 +23,61 @@ class GameState:
         self.move_count = 0
         self.elapsed_time = 0.0  
         self.game_mode = "creative"  
+        
+        # Pieces ordered bottom-to-top; kept in z-index order by DragHandler
+        self.draw_order: List[JigsawPiece] = list(pieces)
+        
+        # Lookup index by grid position
+        self._pos_index: Dict[Tuple[int, int], JigsawPiece] = {
+            piece.original_position: piece for piece in pieces
+        }
+        
+        # Placed piece counter, kept up to date by mark_placed/mark_unplaced
+        self.total_pieces = len(pieces)
+        self.placed_count = sum(1 for piece in pieces if piece.is_placed)
+        self._inv_total = 100.0 / self.total_pieces if self.total_pieces else 0.0
+        
+        # Snap target pixel position by piece_id, filled by set_target_layout
+        self.target_positions: Dict[int, Tuple[int, int]] = {}
+    
+    def set_target_layout(self, origin: Tuple[int, int], piece_size: Tuple[int, int]) -> None:
+        """
+        Compute the correct pixel position of every piece in one pass
+        
+        Args:
+            origin: Top-left pixel position of the grid (x, y)
+            piece_size: Piece size in pixels (width, height)
+        """
+        origin_x, origin_y = origin
+        piece_width, piece_height = piece_size
+        targets = {}
+        for piece in self.pieces:
+            row, col = piece.original_position
+            targets[piece.piece_id] = (origin_x + col * piece_width,
+                                       origin_y + row * piece_height)
+        self.target_positions = targets
+    
+    def mark_placed(self, piece: JigsawPiece) -> None:
+        """
+        Mark a piece as placed in its correct position
+        
+        Args:
+            piece: Piece that has been placed
+        """
+        if not piece.is_placed:
+            piece.is_placed = True
+            self.placed_count += 1
+    
+    def mark_unplaced(self, piece: JigsawPiece) -> None:
+        """
+        Mark a piece as no longer placed
+        
+        Args:
+            piece: Piece to remove from its position
+        """
+        if piece.is_placed:
+            piece.is_placed = False
+            self.placed_count -= 1
     
     def get_piece_at(self, position: Tuple[int, int]) -> Optional[JigsawPiece]:
         """
@@ -34,10 +89,8 @@ class GameState:
         Returns:
             Optional[JigsawPiece]: Piece at position or None
         """
-        for piece in self.pieces:
-            if piece.original_position == position and piece.is_placed:
-                return piece
-        return None
+        piece = self._pos_index.get(position)
+        return piece if piece is not None and piece.is_placed else None
     
     def check_completion(self) -> bool:
         """
@@ -46,14 +99,8 @@ class GameState:
         Returns:
             bool: True if all pieces are in correct positions
         """
-        # Check if all pieces are in correct position
-        for piece in self.pieces:
-            if not piece.is_in_correct_position():
-                self.is_completed = False
-                return False
-        
-        self.is_completed = True
-        return True
+        self.is_completed = self.placed_count == self.total_pieces
+        return self.is_completed
     
     @property
     def completion_percentage(self) -> float:
@@ -63,7 +110,4 @@ class GameState:
         Returns:
             float: Completion percentage (0-100)
         """
-        if not self.pieces:
-            return 0.0
-        placed_count = sum(1 for piece in self.pieces if piece.is_placed)
-        return (placed_count / len(self.pieces)) * 100
+        return self.placed_count * self._inv_total
@@ -1,5 +1,6 @@
 """JigsawPiece model representing a single piece of the jigsaw puzzle"""
 
+from math import sqrt
 from typing import Tuple, Optional
 from pygame import Surface
 
@@ -7,6 +8,9 @@ from pygame import Surface
 class JigsawPiece:
     """Represents a single jigsaw puzzle piece"""
     
+    __slots__ = ('image', 'width', 'height', 'original_position', 'px', 'py',
+                 'piece_id', 'is_dragging', 'is_placed', 'z_index')
+    
     def __init__(self, image: Surface, original_position: Tuple[int, int], 
                  piece_id: int):
         """
@@ -18,13 +22,33 @@ class JigsawPiece:
             piece_id: Unique piece identifier
         """
         self.image = image
+        self.width, self.height = image.get_size()  # Image size, fixed after slicing
         self.original_position = original_position  
-        self.pixel_position: Optional[Tuple[int, int]] = None  
+        self.px: Optional[int] = None  # Pixel position x (None until positioned)
+        self.py: Optional[int] = None  # Pixel position y
         self.piece_id = piece_id
         self.is_dragging = False  
         self.is_placed = False    
         self.z_index = 0          
     
+    @property
+    def pixel_position(self) -> Optional[Tuple[int, int]]:
+        """
+        Current pixel position (x, y) or None if not positioned yet
+        
+        Hot paths read and write px/py directly to avoid building tuples.
+        """
+        if self.px is None:
+            return None
+        return (self.px, self.py)
+    
+    @pixel_position.setter
+    def pixel_position(self, position: Optional[Tuple[int, int]]) -> None:
+        if position is None:
+            self.px = self.py = None
+        else:
+            self.px, self.py = position
+    
     def is_in_correct_position(self) -> bool:
         """
         Check whether the piece is placed in its correct position
@@ -34,6 +58,25 @@ class JigsawPiece:
         """
         return self.is_placed
     
+    def distance_sq_to(self, target_pixel_pos: Tuple[int, int]) -> float:
+        """
+        Calculate the squared pixel distance to the target position
+        
+        Cheaper than distance_to_correct_position when only comparing
+        against a threshold (compare with the squared threshold instead).
+        
+        Args:
+            target_pixel_pos: Target pixel position (x, y)
+            
+        Returns:
+            float: Squared distance in pixels (inf if the piece has no position)
+        """
+        if self.px is None:
+            return float('inf')
+        dx = self.px - target_pixel_pos[0]
+        dy = self.py - target_pixel_pos[1]
+        return dx * dx + dy * dy
+    
     def distance_to_correct_position(self, target_pixel_pos: Tuple[int, int]) -> float:
         """
         Calculate the pixel distance to the correct target position
@@ -44,8 +87,4 @@ class JigsawPiece:
         Returns:
             float: Distance in pixels
         """
-        if self.pixel_position is None:
-            return float('inf')
-        dx = self.pixel_position[0] - target_pixel_pos[0]
-        dy = self.pixel_position[1] - target_pixel_pos[1]
-        return (dx**2 + dy**2) ** 0.5
+        return sqrt(self.distance_sq_to(target_pixel_pos))
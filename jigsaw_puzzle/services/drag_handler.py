@@ -19,10 +19,17 @@ class DragHandler:
         """
         self.game_state = game_state
         self.snap_threshold = snap_threshold
+        self._snap_threshold_sq = snap_threshold * snap_threshold
         self.dragged_piece: Optional[JigsawPiece] = None
-        self.drag_offset: Tuple[int, int] = (0, 0)  
+        self._off_x = 0  # Mouse-to-piece offset, kept as two ints
+        self._off_y = 0
         self._max_z_index = 0  
     
+    @property
+    def drag_offset(self) -> Tuple[int, int]:
+        """Mouse-to-piece offset (x, y) of the current drag"""
+        return (self._off_x, self._off_y)
+    
     def start_drag(self, piece: JigsawPiece, mouse_pos: Tuple[int, int]) -> None:
         """
         Start drag operation
@@ -39,17 +46,20 @@ class DragHandler:
         piece.is_dragging = True
         
         # Calculate mouse-to-piece offset
-        if piece.pixel_position is not None:
-            self.drag_offset = (
-                mouse_pos[0] - piece.pixel_position[0],
-                mouse_pos[1] - piece.pixel_position[1]
-            )
+        if piece.px is not None:
+            self._off_x = mouse_pos[0] - piece.px
+            self._off_y = mouse_pos[1] - piece.py
         else:
-            self.drag_offset = (0, 0)
+            self._off_x = self._off_y = 0
         
         # Bring dragged piece to front (z-index)
         self._max_z_index += 1
         piece.z_index = self._max_z_index
+        
+        # Move it to the top of the draw order (only on drag start, not per frame)
+        draw_order = self.game_state.draw_order
+        draw_order.remove(piece)
+        draw_order.append(piece)
     
     def update_drag(self, mouse_pos: Tuple[int, int]) -> None:
         """
@@ -58,14 +68,13 @@ class DragHandler:
         Args:
             mouse_pos: Current mouse position (x, y)
         """
-        if self.dragged_piece is None:
+        piece = self.dragged_piece
+        if piece is None:
             return
         
-        # Compute new position (apply offset)
-        new_x = mouse_pos[0] - self.drag_offset[0]
-        new_y = mouse_pos[1] - self.drag_offset[1]
-        
-        self.dragged_piece.pixel_position = (new_x, new_y)
+        # Compute new position (apply offset), no tuple allocation
+        piece.px = mouse_pos[0] - self._off_x
+        piece.py = mouse_pos[1] - self._off_y
     
     def end_drag(self) -> bool:
         """
@@ -74,16 +83,17 @@ class DragHandler:
         Returns:
             bool: True if piece placed to correct position
         """
-        if self.dragged_piece is None:
+        piece = self.dragged_piece
+        if piece is None:
             return False
         
         # Perform snap check
-        snapped = self.check_snap_to_grid(self.dragged_piece)
+        snapped = self.check_snap_to_grid(piece)
         
         # Turn off dragging state
-        self.dragged_piece.is_dragging = False
+        piece.is_dragging = False
         self.dragged_piece = None
-        self.drag_offset = (0, 0)
+        self._off_x = self._off_y = 0
         
         return snapped
     
@@ -97,30 +107,24 @@ class DragHandler:
         Returns:
             bool: True if the piece gets placed
         """
-        if piece is None or piece.pixel_position is None:
+        if piece is None:
             return False
         
-        # Compute target position
-        # Requires play area info
-        # Early return if already placed
-        if piece.is_placed:
+        # Single guarded early-exit: no position yet, already placed, or no
+        # target assigned (targets are computed once the layout is known)
+        target_pos = self.game_state.target_positions.get(piece.piece_id)
+        if piece.px is None or piece.is_placed or target_pos is None:
             return False
         
-        # Use grid/layout info to compute correct position
-        # Currently relies on GameRenderer to set target position
-        
-        # If the piece has target_pixel_position (set by GameRenderer)
-        if hasattr(piece, 'target_pixel_position') and piece.target_pixel_position is not None:
-            target_pos = piece.target_pixel_position
-            distance = piece.distance_to_correct_position(target_pos)
-            
-            # Snap when within threshold
-            if distance <= self.snap_threshold:
-                piece.pixel_position = target_pos
-                piece.is_placed = True
-                return True
+        # Not within threshold yet (compared squared, no sqrt needed)
+        dx = piece.px - target_pos[0]
+        dy = piece.py - target_pos[1]
+        if dx * dx + dy * dy > self._snap_threshold_sq:
+            return False
         
-        return False
+        piece.px, piece.py = target_pos
+        self.game_state.mark_placed(piece)
+        return True
     
     def cancel_drag(self) -> None:
         """
@@ -129,4 +133,4 @@ class DragHandler:
         if self.dragged_piece is not None:
             self.dragged_piece.is_dragging = False
             self.dragged_piece = None
-            self.drag_offset = (0, 0)
+            self._off_x = self._off_y = 0
@@ -1,8 +1,97 @@
 """Image processing service for loading and splitting images"""
 
+import functools
+import os
 from typing import List, Tuple
 from PIL import Image, UnidentifiedImageError
 import pygame
+from jigsaw_puzzle.utils.constants import LOAD_REDUCING_GAP
+
+
+@functools.lru_cache(maxsize=32)
+def _piece_rects(width: int, height: int, rows: int,
+                 cols: int) -> Tuple[Tuple[int, int, int, int], ...]:
+    """
+    Compute crop boxes of every piece for an image/grid combination
+    
+    Args:
+        width: Image width
+        height: Image height
+        rows: Grid rows
+        cols: Grid columns
+        
+    Returns:
+        Crop boxes (left, top, right, bottom), left-to-right, top-to-bottom
+    """
+    piece_width = width // cols
+    piece_height = height // rows
+    return tuple(
+        (col * piece_width, row * piece_height,
+         col * piece_width + piece_width, row * piece_height + piece_height)
+        for row in range(rows)
+        for col in range(cols)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_scaled(file_path: str, mtime: float, target_width: int, target_height: int,
+                 rows: int, cols: int) -> Image.Image:
+    """
+    Load an image file and scale/crop it to fill the grid exactly
+    
+    Cached per file and layout; mtime is part of the key so edits to the
+    file invalidate the cached result. Callers must not mutate the returned
+    image (ImageProcessor.load_image hands out copies).
+    
+    Args:
+        file_path: Path to the image file
+        mtime: File modification time (cache key only)
+        target_width: Target area width
+        target_height: Target area height
+        rows: Grid rows
+        cols: Grid columns
+        
+    Returns:
+        PIL Image scaled to fit the grid exactly
+    """
+    image = Image.open(file_path)
+    
+    # Compute each piece size
+    piece_width = target_width // cols
+    piece_height = target_height // rows
+    
+    # Compute final image size based on piece count
+    # Ensures no empty space remains
+    final_width = piece_width * cols
+    final_height = piece_height * rows
+    
+    # Scale while preserving aspect ratio
+    img_ratio = image.width / image.height
+    target_ratio = final_width / final_height
+    
+    if img_ratio > target_ratio:
+        # Image is wider: scale by height and crop
+        scale = final_height / image.height
+        new_width = int(image.width * scale)
+        new_height = final_height
+    else:
+        # Image is taller: scale by width and crop
+        scale = final_width / image.width
+        new_width = final_width
+        new_height = int(image.height * scale)
+    
+    # Large downscales: reducing_gap makes PIL do a cheap integer box reduce
+    # first so LANCZOS only runs on a fraction of the source pixels (PIL
+    # skips that step itself for modes reduce() can't handle, e.g. "P")
+    image = image.resize((new_width, new_height), Image.Resampling.LANCZOS,
+                         reducing_gap=LOAD_REDUCING_GAP)
+    
+    # Center crop
+    left = (new_width - final_width) // 2
+    top = (new_height - final_height) // 2
+    image = image.crop((left, top, left + final_width, top + final_height))
+    
+    return image
 
 
 class ImageProcessor:
@@ -27,49 +116,13 @@ class ImageProcessor:
             UnidentifiedImageError: When the image format is invalid
         """
         try:
-            image = Image.open(file_path)
-            
+            mtime = os.path.getmtime(file_path)
             rows, cols = grid_size
+            image = _load_scaled(file_path, mtime, target_area.width, target_area.height,
+                                 rows, cols)
             
-            # Get target dimensions
-            target_width = target_area.width
-            target_height = target_area.height
-            
-            # Compute each piece size
-            piece_width = target_width // cols
-            piece_height = target_height // rows
-            
-            # Compute final image size based on piece count
-            # Ensures no empty space remains
-            final_width = piece_width * cols
-            final_height = piece_height * rows
-            
-            # Scale while preserving aspect ratio
-            img_ratio = image.width / image.height
-            target_ratio = final_width / final_height
-            
-            if img_ratio > target_ratio:
-                # Image is wider: scale by height and crop
-                scale = final_height / image.height
-                new_width = int(image.width * scale)
-                new_height = final_height
-                image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                
-                # Center crop
-                left = (new_width - final_width) // 2
-                image = image.crop((left, 0, left + final_width, final_height))
-            else:
-                # Image is taller: scale by width and crop
-                scale = final_width / image.width
-                new_width = final_width
-                new_height = int(image.height * scale)
-                image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                
-                # Center crop
-                top = (new_height - final_height) // 2
-                image = image.crop((0, top, final_width, top + final_height))
-            
-            return image
+            # Hand out a copy so the cached image stays untouched
+            return image.copy()
             
         except FileNotFoundError:
             raise FileNotFoundError(f"Image file not found: {file_path}")
@@ -91,24 +144,57 @@ class ImageProcessor:
         rows, cols = grid_size
         width, height = image.size
         
-        piece_width = width // cols
-        piece_height = height // rows
+        # Crop boxes are cached per (image size, grid size)
+        return [image.crop(box) for box in _piece_rects(width, height, rows, cols)]
+    
+    @staticmethod
+    def split_surface(surface: pygame.Surface, grid_size: Tuple[int, int]) -> List[pygame.Surface]:
+        """
+        Split a pygame Surface into equal pieces based on grid_size
         
-        pieces = []
+        Pieces are subsurfaces, i.e. views sharing pixels with the source
+        surface, so no pixel data is copied. Call copy() on a piece if it
+        must be modified independently.
         
-        for row in range(rows):
-            for col in range(cols):
-                # Top-left coordinates of each piece
-                left = col * piece_width
-                top = row * piece_height
-                right = left + piece_width
-                bottom = top + piece_height
-                
-                # Crop the piece
-                piece = image.crop((left, top, right, bottom))
-                pieces.append(piece)
+        Args:
+            surface: pygame Surface to be split
+            grid_size: Grid size (rows, cols)
+            
+        Returns:
+            List of pygame Surface pieces (left-to-right, top-to-bottom)
+        """
+        rows, cols = grid_size
+        width, height = surface.get_size()
         
-        return pieces
+        return [
+            surface.subsurface((left, top, right - left, bottom - top))
+            for left, top, right, bottom in _piece_rects(width, height, rows, cols)
+        ]
+    
+    @staticmethod
+    def split_to_pygame(image: Image.Image, grid_size: Tuple[int, int]) -> List[pygame.Surface]:
+        """
+        Split the image into pygame Surface pieces based on grid_size
+        
+        The whole image is converted to a pygame Surface once and then
+        sliced, instead of cropping and converting every piece separately.
+        When a display mode is set, the surface is first converted to the
+        display pixel format so blitting the pieces needs no conversion.
+        
+        Args:
+            image: PIL Image to be split
+            grid_size: Grid size (rows, cols)
+            
+        Returns:
+            List of pygame Surface pieces (left-to-right, top-to-bottom)
+        """
+        surface = ImageProcessor.pil_to_pygame(image)
+        if pygame.display.get_surface() is not None:
+            if surface.get_flags() & pygame.SRCALPHA:
+                surface = surface.convert_alpha()
+            else:
+                surface = surface.convert()
+        return ImageProcessor.split_surface(surface, grid_size)
     
     @staticmethod
     def pil_to_pygame(pil_image: Image.Image) -> pygame.Surface:
@@ -121,18 +207,18 @@ class ImageProcessor:
         Returns:
             pygame Surface
         """
-        # Convert PIL Image to RGB mode
-        if pil_image.mode != 'RGB':
+        # RGB and RGBA map straight onto pygame buffer formats;
+        # anything else needs a full-image conversion to RGB first
+        mode = pil_image.mode
+        if mode not in ('RGB', 'RGBA'):
             pil_image = pil_image.convert('RGB')
+            mode = 'RGB'
         
-        # Convert PIL Image to string buffer
-        image_string = pil_image.tobytes()
-        size = pil_image.size
-        
-        # Create pygame Surface
-        surface = pygame.image.fromstring(image_string, size, 'RGB')
-        
-        return surface
+        # frombuffer returns a writable Surface backed directly by the buffer
+        # (drawing on it or on its subsurface pieces writes into that memory),
+        # so hand it a private mutable bytearray rather than the immutable
+        # bytes from tobytes(); the Surface keeps a reference to it
+        return pygame.image.frombuffer(bytearray(pil_image.tobytes()), pil_image.size, mode)
     
     @staticmethod
     def create_thumbnail(image: Image.Image, size: Tuple[int, int]) -> Image.Image:
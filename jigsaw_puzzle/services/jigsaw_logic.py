@@ -28,17 +28,16 @@ class JigsawLogic:
         Args:
             piece_pool_area: Area to scatter the pieces into
         """
+        # Pool bounds and RNG lookup hoisted out of the per-piece loop
+        randint = random.randint
+        left, top = piece_pool_area.x, piece_pool_area.y
+        right = piece_pool_area.x + piece_pool_area.width
+        bottom = piece_pool_area.y + piece_pool_area.height
+        
         for piece in self.game_state.pieces:
-            # Rastgele pozisyon hesapla
-            x = random.randint(
-                piece_pool_area.x,
-                piece_pool_area.x + piece_pool_area.width - piece.image.get_width()
-            )
-            y = random.randint(
-                piece_pool_area.y,
-                piece_pool_area.y + piece_pool_area.height - piece.image.get_height()
-            )
-            piece.pixel_position = (x, y)
+            # Random position keeping the whole piece inside the pool
+            piece.px = randint(left, right - piece.width)
+            piece.py = randint(top, bottom - piece.height)
     
     def get_piece_at_position(self, mouse_pos: Tuple[int, int]) -> Optional[JigsawPiece]:
         """
@@ -50,27 +49,18 @@ class JigsawLogic:
         Returns:
             Optional[JigsawPiece]: Found piece or None
         """
-        # Sort by z-index (topmost first)
-        sorted_pieces = sorted(
-            self.game_state.pieces,
-            key=lambda p: p.z_index,
-            reverse=True
-        )
+        mouse_x, mouse_y = mouse_pos
         
-        for piece in sorted_pieces:
-            if piece.pixel_position is None:
+        # draw_order is kept sorted bottom-to-top by DragHandler,
+        # so walk it backwards (topmost first) instead of re-sorting
+        for piece in reversed(self.game_state.draw_order):
+            x = piece.px
+            if x is None:
                 continue
             
-            # Create piece rect
-            piece_rect = pygame.Rect(
-                piece.pixel_position[0],
-                piece.pixel_position[1],
-                piece.image.get_width(),
-                piece.image.get_height()
-            )
-            
-            # Check if mouse position is within the piece
-            if piece_rect.collidepoint(mouse_pos):
+            # Check if mouse position is within the piece (same bounds
+            # as pygame.Rect.collidepoint, without building a Rect)
+            if x <= mouse_x < x + piece.width and piece.py <= mouse_y < piece.py + piece.height:
                 return piece
         
         return None
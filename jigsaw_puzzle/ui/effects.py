@@ -1,9 +1,19 @@
 """
 Visual effects module
 """
+import weakref
 import pygame
-from typing import Tuple
+from typing import Dict, Tuple
 from ..utils.constants import SHADOW_COLOR, SHADOW_OFFSET, HOVER_SCALE
+
+
+# Filled shadow surfaces by size (pieces share one size, so ~1 entry)
+_shadow_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+
+# Scaled hover surface per source surface, stored as (scale, scaled);
+# entries are dropped when the source surface is garbage collected
+_hover_cache: "weakref.WeakKeyDictionary[pygame.Surface, Tuple[float, pygame.Surface]]" = \
+    weakref.WeakKeyDictionary()
 
 
 class Effects:
@@ -24,9 +34,13 @@ class Effects:
         shadow_rect.x += offset
         shadow_rect.y += offset
         
-        # Create semi-transparent shadow surface
-        shadow_surface = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-        shadow_surface.fill(SHADOW_COLOR)
+        # Reuse semi-transparent shadow surface of this size (created once)
+        size = shadow_rect.size
+        shadow_surface = _shadow_cache.get(size)
+        if shadow_surface is None:
+            shadow_surface = pygame.Surface(size, pygame.SRCALPHA)
+            shadow_surface.fill(SHADOW_COLOR)
+            _shadow_cache[size] = shadow_surface
         
         # Draw shadow
         surface.blit(shadow_surface, shadow_rect)
@@ -36,6 +50,10 @@ class Effects:
         """
         Scaling effect for dragged piece
         
+        The scaled surface is computed once per source surface and scale,
+        then reused; piece images must not be modified after creation and
+        callers must not modify the returned surface.
+        
         Args:
             piece_surface: Original piece surface
             scale: Scale factor (e.g., 1.05 = 5% larger)
@@ -43,6 +61,10 @@ class Effects:
         Returns:
             Scaled surface
         """
+        cached = _hover_cache.get(piece_surface)
+        if cached is not None and cached[0] == scale:
+            return cached[1]
+        
         # Get original dimensions
         original_width = piece_surface.get_width()
         original_height = piece_surface.get_height()
@@ -53,6 +75,7 @@ class Effects:
         
         # Scale surface
         scaled_surface = pygame.transform.smoothscale(piece_surface, (new_width, new_height))
+        _hover_cache[piece_surface] = (scale, scaled_surface)
         
         return scaled_surface
     
@@ -77,9 +100,10 @@ class Effects:
         # Alpha value for slight fade-in during animation
         alpha = int(255 * (0.5 + 0.5 * progress))  
         
-        # Create temporary surface and apply alpha
-        temp_surface = piece_image.copy()
-        temp_surface.set_alpha(alpha)
+        # Apply alpha on the source for this blit only (no per-frame copy)
+        previous_alpha = piece_image.get_alpha()
+        piece_image.set_alpha(alpha)
         
         # Draw piece at current position
-        screen.blit(temp_surface, (int(current_x), int(current_y)))
+        screen.blit(piece_image, (int(current_x), int(current_y)))
+        piece_image.set_alpha(previous_alpha)
@@ -1,7 +1,7 @@
 """GameRenderer UI component for rendering the jigsaw puzzle game using pygame"""
 
 import pygame
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from jigsaw_puzzle.models.game_state import GameState
 from jigsaw_puzzle.models.jigsaw_piece import JigsawPiece
 from jigsaw_puzzle.ui.effects import Effects
@@ -12,15 +12,27 @@ from jigsaw_puzzle.utils.constants import (
     GRID_LINE_COLOR,
     TEXT_COLOR,
     GRID_LINE_WIDTH,
+    SHADOW_OFFSET,
     MARGIN,
     PLAY_AREA_WIDTH_RATIO,
-    PIECE_POOL_WIDTH_RATIO
+    PIECE_POOL_WIDTH_RATIO,
+    TEXT_CACHE_SIZE
 )
 
 
 class GameRenderer:
     """Render the game using modern pygame"""
     
+    # Event types the game loop reacts to (see consume_events)
+    HANDLED_EVENT_TYPES = (
+        pygame.QUIT,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEBUTTONUP,
+        pygame.KEYDOWN,
+        pygame.WINDOWEXPOSED
+    )
+    
     def __init__(self, screen_size: Tuple[int, int], game_state: GameState, 
                  preview_image: Optional[pygame.Surface] = None):
         """
@@ -34,7 +46,12 @@ class GameRenderer:
         self.screen_size = screen_size
         self.game_state = game_state
         self.screen = pygame.display.set_mode(screen_size)
+        self._has_fblits = hasattr(self.screen, 'fblits')  # pygame-ce only
         self.effects = Effects()
+        
+        # Fonts by size and rendered text surfaces, reused across frames
+        self._fonts: Dict[int, pygame.font.Font] = {}
+        self._text_cache: Dict[Tuple[str, int, Tuple[int, ...]], pygame.Surface] = {}
         self.preview_image = preview_image  
         
         # Set window title
@@ -47,8 +64,40 @@ class GameRenderer:
         self.preview_area: Optional[pygame.Rect] = None
         self.info_area: Optional[pygame.Rect] = None
         
+        # Completion overlay and message box, built on first use
+        self._completion_overlay: Optional[pygame.Surface] = None
+        self._completion_box: Optional[pygame.Surface] = None
+        self._completion_key = None
+        
+        # Incremental redraw state (see render_incremental)
+        self._needs_full_redraw = True
+        self._last_completed = game_state.is_completed
+        self._last_top_bounds: Optional[pygame.Rect] = None
+        self._completion_frame_key = None
+        
+        self._convert_piece_images()
         self._calculate_layout()
     
+    def _convert_piece_images(self):
+        """
+        Ensure every piece image uses the display pixel format
+        
+        Blitting a surface in another format makes SDL convert pixels on
+        every blit. Pieces from ImageProcessor.split_to_pygame are already
+        converted and are left untouched (they stay views of one surface);
+        any other piece image is converted once here.
+        """
+        display_bitsize = self.screen.get_bitsize()
+        display_masks = self.screen.get_masks()[:3]
+        for piece in self.game_state.pieces:
+            image = piece.image
+            if (image.get_bitsize() != display_bitsize
+                    or image.get_masks()[:3] != display_masks):
+                if image.get_flags() & pygame.SRCALPHA:
+                    piece.image = image.convert_alpha()
+                else:
+                    piece.image = image.convert()
+    
     def _calculate_layout(self):
         """
         Calculate screen layout (PlayArea, PiecePool, Preview, Info)
@@ -96,6 +145,45 @@ class GameRenderer:
             preview_size
         )
         
+        # Pre-scale the preview once (preview_area is fixed after layout)
+        self._preview_scaled: Optional[pygame.Surface] = None
+        self._preview_pos = (0, 0)
+        if self.preview_image:
+            # Fit the image to preview_area (preserve aspect ratio)
+            preview_width = self.preview_area.width - 10  # 5px padding each side
+            preview_height = self.preview_area.height - 10
+            
+            # Original image size
+            img_width = self.preview_image.get_width()
+            img_height = self.preview_image.get_height()
+            
+            # Calculate aspect ratio
+            scale_x = preview_width / img_width
+            scale_y = preview_height / img_height
+            scale = min(scale_x, scale_y)
+            
+            # New size
+            new_width = int(img_width * scale)
+            new_height = int(img_height * scale)
+            
+            # Scale image
+            preview_scaled = pygame.transform.smoothscale(
+                self.preview_image, 
+                (new_width, new_height)
+            )
+            
+            # Display pixel format, so the per-frame blit needs no conversion
+            if preview_scaled.get_flags() & pygame.SRCALPHA:
+                self._preview_scaled = preview_scaled.convert_alpha()
+            else:
+                self._preview_scaled = preview_scaled.convert()
+            
+            # Center align
+            self._preview_pos = (
+                self.preview_area.x + (self.preview_area.width - new_width) // 2,
+                self.preview_area.y + (self.preview_area.height - new_height) // 2
+            )
+        
         # Info area (bottom right - info panel)
         # Takes remaining space
         info_height = screen_height - self.preview_area.bottom - MARGIN * 2
@@ -105,22 +193,143 @@ class GameRenderer:
             right_side_width,
             info_height
         )
+        
+        # Composite info panel surface, rebuilt by draw_info_panel on change
+        self._info_panel_surface = pygame.Surface(self.info_area.size)
+        self._info_panel_key = None
+        
+        # Static background and preview panel
+        self._build_static_background()
+        
+        # Snap targets for every piece, computed once per layout
+        rows, cols = self.game_state.grid_size
+        self.game_state.set_target_layout(
+            self.play_area.topleft,
+            (self.play_area.width // cols, self.play_area.height // rows)
+        )
+    
+    def _build_static_background(self):
+        """
+        Pre-render everything that does not change after layout
+        
+        Builds the full-screen background (window fill, PlayArea with grid
+        lines and frame, PiecePool background and frame) and the framed
+        preview panel, so render only blits them instead of issuing the
+        fill/line/rect draw calls every frame.
+        """
+        background = pygame.Surface(self.screen_size).convert()
+        
+        # Clear background
+        background.fill(BACKGROUND_COLOR)
+        
+        # PlayArea background (drawn through a subsurface in local coords)
+        play_area = background.subsurface(self.play_area)
+        area = play_area.get_rect()
+        play_area.fill(PLAY_AREA_BG)
+        
+        # Draw grid lines
+        rows, cols = self.game_state.grid_size
+        
+        # Compute piece dimensions
+        piece_width = area.width // cols
+        piece_height = area.height // rows
+        
+        # Vertical lines (between columns)
+        for col in range(1, cols):
+            x = col * piece_width
+            pygame.draw.line(
+                play_area,
+                GRID_LINE_COLOR,
+                (x, 0),
+                (x, area.bottom),
+                GRID_LINE_WIDTH
+            )
+        
+        # Horizontal lines (between rows)
+        for row in range(1, rows):
+            y = row * piece_height
+            pygame.draw.line(
+                play_area,
+                GRID_LINE_COLOR,
+                (0, y),
+                (area.right, y),
+                GRID_LINE_WIDTH
+            )
+        
+        # PlayArea frame
+        pygame.draw.rect(play_area, GRID_LINE_COLOR, area, GRID_LINE_WIDTH)
+        
+        # PiecePool background and frame
+        pygame.draw.rect(background, PIECE_POOL_BG, self.piece_pool)
+        pygame.draw.rect(background, GRID_LINE_COLOR, self.piece_pool, GRID_LINE_WIDTH)
+        
+        self._static_bg = background
+        
+        # Preview panel: drawn after the pieces, so it stays a separate surface
+        preview = pygame.Surface(self.preview_area.size).convert()
+        
+        # Preview background (white)
+        preview.fill((255, 255, 255))
+        
+        if self._preview_scaled is not None:
+            preview.blit(
+                self._preview_scaled,
+                (self._preview_pos[0] - self.preview_area.x,
+                 self._preview_pos[1] - self.preview_area.y)
+            )
+        else:
+            # Show "Preview" text if no preview image
+            text = self._render_text("Preview", 24, (100, 100, 100))
+            text_rect = text.get_rect(center=preview.get_rect().center)
+            preview.blit(text, text_rect)
+        
+        # Preview frame
+        pygame.draw.rect(preview, GRID_LINE_COLOR, preview.get_rect(), 2)
+        
+        self._preview_panel = preview
+    
+    def _render_text(self, text: str, size: int, color: Tuple[int, ...]) -> pygame.Surface:
+        """
+        Render text with the default font, reusing earlier renders
+        
+        Args:
+            text: Text to render
+            size: Font size
+            color: Text color (RGB)
+            
+        Returns:
+            Rendered text surface (shared; do not modify)
+        """
+        key = (text, size, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            font = self._fonts.get(size)
+            if font is None:
+                font = self._fonts[size] = pygame.font.Font(None, size)
+            
+            # Changing values (time, moves) keep adding entries; start over when full
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            # Converted once to the display's alpha format for cheaper blits
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
     
     def render(self):
         """
         Main render method - draws the entire game screen
         
         Draw order:
-        1. Background
-        2. PlayArea (grid + placed pieces)
+        1. Static background (window, PlayArea grid, PiecePool)
+        2. PlayArea (placed pieces)
         3. PiecePool (unplaced pieces)
         4. Preview
         5. Info Panel
         """
-        # Clear background
-        self.screen.fill(BACKGROUND_COLOR)
+        # Static background, pre-rendered at layout
+        self.screen.blit(self._static_bg, (0, 0))
         
-        # Draw PlayArea (grid + placed pieces)
+        # Draw PlayArea (placed pieces)
         self.draw_play_area()
         
         # Draw PiecePool (mixed pieces)
@@ -130,52 +339,159 @@ class GameRenderer:
         self.draw_preview()
         self.draw_info_panel()
     
-    def draw_play_area(self):
-        """
-        Draw PlayArea (grid lines + placed pieces)
-        
-        PlayArea is the area where puzzle pieces are placed.
-        Grid lines indicate piece boundaries.
-        """
-        # PlayArea background
-        pygame.draw.rect(self.screen, PLAY_AREA_BG, self.play_area)
+    def consume_events(self, types: Tuple[int, ...] = HANDLED_EVENT_TYPES) -> List[pygame.event.Event]:
+        """
+        Drain only the given event types from the queue
         
-        # Draw grid lines
-        rows, cols = self.game_state.grid_size
+        Args:
+            types: Event types to return (defaults to HANDLED_EVENT_TYPES)
+            
+        Returns:
+            List[pygame.event.Event]: Pending events of those types
+        """
+        return pygame.event.get(types)
+    
+    def _blit_batch(self, sequence: List[Tuple[pygame.Surface, Tuple[int, int]]]):
+        """
+        Blit many (surface, position) pairs onto the screen in one call
         
-        # Compute piece dimensions
-        piece_width = self.play_area.width // cols
-        piece_height = self.play_area.height // rows
+        Uses pygame-ce's fblits when available, otherwise blits.
         
-        # Vertical lines (between columns)
-        for col in range(1, cols):
-            x = self.play_area.x + col * piece_width
-            pygame.draw.line(
-                self.screen,
-                GRID_LINE_COLOR,
-                (x, self.play_area.y),
-                (x, self.play_area.bottom),
-                GRID_LINE_WIDTH
-            )
+        Args:
+            sequence: (surface, position) pairs in drawing order
+        """
+        if self._has_fblits:
+            self.screen.fblits(sequence)
+        else:
+            self.screen.blits(sequence, False)
+    
+    def invalidate(self):
+        """
+        Force the next render_incremental call to repaint the whole screen
         
-        # Horizontal lines (between rows)
-        for row in range(1, rows):
-            y = self.play_area.y + row * piece_height
-            pygame.draw.line(
-                self.screen,
-                GRID_LINE_COLOR,
-                (self.play_area.x, y),
-                (self.play_area.right, y),
-                GRID_LINE_WIDTH
+        Call after moving pieces outside of a drag (e.g., re-scattering).
+        """
+        self._needs_full_redraw = True
+    
+    def _piece_bounds(self, piece: JigsawPiece) -> Optional[pygame.Rect]:
+        """
+        Screen area covered by a piece as drawn by draw_piece
+        
+        Args:
+            piece: Jigsaw piece
+            
+        Returns:
+            Optional[pygame.Rect]: Covered area (incl. shadow and hover
+            scaling while dragging) or None if the piece has no position
+        """
+        if piece.px is None:
+            return None
+        
+        width, height = piece.width, piece.height
+        bounds = pygame.Rect(piece.px, piece.py, width, height)
+        if piece.is_dragging:
+            scaled_width, scaled_height = self.effects.apply_hover_effect(piece.image).get_size()
+            hover_rect = pygame.Rect(
+                piece.px - (scaled_width - width) // 2,
+                piece.py - (scaled_height - height) // 2,
+                scaled_width,
+                scaled_height
             )
+            bounds = bounds.move(SHADOW_OFFSET, SHADOW_OFFSET).union(hover_rect)
+        return bounds
+    
+    def render_incremental(self) -> List[pygame.Rect]:
+        """
+        Repaint only the screen regions that changed since the last call
+        
+        Dirty regions are the info panel when a shown value changed and the
+        old and new area of the topmost piece (the one being dragged or just
+        dropped) when it moved or changed state. Each region is repainted with
+        the screen clip set to it; nothing is drawn when nothing changed. The
+        whole screen is repainted on the first call, when the completion state
+        changes, after invalidate(), or when the dirty regions add up to more
+        than half of the screen.
+        
+        Returns:
+            List[pygame.Rect]: Regions to pass to pygame.display.update
+            (empty when the screen is unchanged)
+        """
+        draw_order = self.game_state.draw_order
+        bounds = self._piece_bounds(draw_order[-1]) if draw_order else None
+        completed = self.game_state.is_completed
+        
+        if self._needs_full_redraw or completed != self._last_completed:
+            self._needs_full_redraw = False
+            self._last_completed = completed
+            self._last_top_bounds = bounds
+            self.render()
+            return [self.screen.get_rect()]
+        
+        dirty = []
+        if self._info_panel_state() != self._info_panel_key:
+            dirty.append(self.info_area)
+        if bounds != self._last_top_bounds:
+            if self._last_top_bounds is not None:
+                dirty.append(self._last_top_bounds)
+            if bounds is not None:
+                dirty.append(bounds)
+            self._last_top_bounds = bounds
+        
+        # Mostly dirty anyway: one unclipped pass beats several clipped ones
+        screen_rect = self.screen.get_rect()
+        if sum(rect.w * rect.h for rect in dirty) > screen_rect.w * screen_rect.h // 2:
+            self.render()
+            return [screen_rect]
+        
+        for rect in dirty:
+            self.screen.set_clip(rect)
+            self.render()
+        self.screen.set_clip(None)
+        
+        return dirty
+    
+    def render_completion(self) -> List[pygame.Rect]:
+        """
+        Repaint the end screen (game plus completion message) when it changed
         
-        # PlayArea frame
-        pygame.draw.rect(self.screen, GRID_LINE_COLOR, self.play_area, GRID_LINE_WIDTH)
+        The end screen is static apart from the shown time and counts, so it
+        is only redrawn when those change, when the game has just ended, or
+        after invalidate().
         
-        # Draw placed pieces
-        for piece in self.game_state.pieces:
-            if piece.is_placed:
-                self.draw_piece(piece)
+        Returns:
+            List[pygame.Rect]: Regions to pass to pygame.display.update
+            (empty when the screen is unchanged)
+        """
+        key = (self._info_panel_state(), self.game_state.is_failed)
+        if (not self._needs_full_redraw and self._last_completed
+                and key == self._completion_frame_key):
+            return []
+        
+        self._needs_full_redraw = False
+        self._last_completed = True
+        self._completion_frame_key = key
+        self.render()
+        self.show_completion_message()
+        return [self.screen.get_rect()]
+    
+    def draw_play_area(self):
+        """
+        Draw PlayArea placed pieces
+        
+        PlayArea is the area where puzzle pieces are placed. Its background
+        and grid lines are part of the static background.
+        """
+        # Draw placed pieces (never dragged) in a single batched blit call,
+        # culling pieces outside the current clip (the dirty region)
+        clip = self.screen.get_clip()
+        left, top, right, bottom = clip.left, clip.top, clip.right, clip.bottom
+        self._blit_batch(
+            [(piece.image, (piece.px, piece.py))
+             for piece in self.game_state.pieces
+             if piece.is_placed
+             and piece.px < right and piece.py < bottom
+             and piece.px + piece.width > left and piece.py + piece.height > top]
+        )
     
     def draw_piece_pool(self):
         """
@@ -184,18 +500,26 @@ class GameRenderer:
         PiecePool contains unplaced pieces.
         Pieces are ordered by z-index (dragged piece on top).
         """
-        # PiecePool background
-        pygame.draw.rect(self.screen, PIECE_POOL_BG, self.piece_pool)
-        
-        # PiecePool frame
-        pygame.draw.rect(self.screen, GRID_LINE_COLOR, self.piece_pool, GRID_LINE_WIDTH)
-        
-        # Draw unplaced pieces
-        # Sort by z-index (lower first, higher last)
-        unplaced_pieces = [p for p in self.game_state.pieces if not p.is_placed]
-        sorted_pieces = sorted(unplaced_pieces, key=lambda p: p.z_index)
-        
-        for piece in sorted_pieces:
+        # Draw unplaced pieces (background and frame are in the static background)
+        # draw_order is already sorted by z-index (lower first, higher last);
+        # resting pieces go in one batched blit, the dragged piece (always
+        # on top) is drawn afterwards with its effects
+        clip = self.screen.get_clip()
+        left, top, right, bottom = clip.left, clip.top, clip.right, clip.bottom
+        batch = []
+        dragged = []
+        for piece in self.game_state.draw_order:
+            if piece.is_placed or piece.px is None:
+                continue
+            if piece.is_dragging:
+                dragged.append(piece)
+            elif (piece.px < right and piece.py < bottom
+                  and piece.px + piece.width > left and piece.py + piece.height > top):
+                # Only pieces intersecting the current clip (the dirty region)
+                batch.append((piece.image, (piece.px, piece.py)))
+        
+        self._blit_batch(batch)
+        for piece in dragged:
             self.draw_piece(piece)
     
     def draw_piece(self, piece: JigsawPiece):
@@ -212,40 +536,37 @@ class GameRenderer:
         For normal pieces:
         - Draw directly
         """
-        if piece.pixel_position is None:
+        if piece.px is None:
             return
         
-        # Create piece rect
-        piece_rect = pygame.Rect(
-            piece.pixel_position[0],
-            piece.pixel_position[1],
-            piece.image.get_width(),
-            piece.image.get_height()
-        )
-        
         # Shadow and hover effects (if dragging)
         if piece.is_dragging:
-            # Draw shadow
+            # Draw shadow (the only place a piece rect is needed)
+            piece_rect = pygame.Rect(
+                piece.px,
+                piece.py,
+                piece.width,
+                piece.height
+            )
             self.effects.draw_shadow(self.screen, piece_rect)
             
             # Apply hover effect (slight scaling)
             scaled_image = self.effects.apply_hover_effect(piece.image)
             
             # Center the scaled piece
-            scaled_width = scaled_image.get_width()
-            scaled_height = scaled_image.get_height()
-            offset_x = (scaled_width - piece.image.get_width()) // 2
-            offset_y = (scaled_height - piece.image.get_height()) // 2
+            scaled_width, scaled_height = scaled_image.get_size()
+            offset_x = (scaled_width - piece.width) // 2
+            offset_y = (scaled_height - piece.height) // 2
             
             adjusted_pos = (
-                piece.pixel_position[0] - offset_x,
-                piece.pixel_position[1] - offset_y
+                piece.px - offset_x,
+                piece.py - offset_y
             )
             
             self.screen.blit(scaled_image, adjusted_pos)
         else:
-            # Normal draw (no shadow, no scaling)
-            self.screen.blit(piece.image, piece.pixel_position)
+            # Normal draw (no shadow, no scaling), no Rect allocation
+            self.screen.blit(piece.image, (piece.px, piece.py))
     
     def draw_preview(self):
         """
@@ -254,50 +575,8 @@ class GameRenderer:
         The preview helps the user see the completed image.
         Image is fit into preview_area while preserving aspect ratio.
         """
-        # Preview background (white)
-        pygame.draw.rect(self.screen, (255, 255, 255), self.preview_area)
-        
-        # If preview image exists, draw it
-        if self.preview_image:
-            # Fit the image to preview_area (preserve aspect ratio)
-            preview_width = self.preview_area.width - 10  # 5px padding her yandan
-            preview_height = self.preview_area.height - 10
-            
-            # Original image size
-            img_width = self.preview_image.get_width()
-            img_height = self.preview_image.get_height()
-            
-            # Calculate aspect ratio
-            scale_x = preview_width / img_width
-            scale_y = preview_height / img_height
-            scale = min(scale_x, scale_y)
-            
-            # New size
-            new_width = int(img_width * scale)
-            new_height = int(img_height * scale)
-            
-            # Scale image
-            scaled_preview = pygame.transform.smoothscale(
-                self.preview_image, 
-                (new_width, new_height)
-            )
-            
-            # Center align
-            x = self.preview_area.x + (self.preview_area.width - new_width) // 2
-            y = self.preview_area.y + (self.preview_area.height - new_height) // 2
-            
-            self.screen.blit(scaled_preview, (x, y))
-        else:
-            # Show "Preview" text if no preview image
-            font = pygame.font.Font(None, 24)
-            text = font.render("Preview", True, (100, 100, 100))
-            text_rect = text.get_rect(
-                center=(self.preview_area.centerx, self.preview_area.centery)
-            )
-            self.screen.blit(text, text_rect)
-        
-        # Preview frame
-        pygame.draw.rect(self.screen, GRID_LINE_COLOR, self.preview_area, 2)
+        # Preview panel (background, image and frame) pre-rendered at layout
+        self.screen.blit(self._preview_panel, self.preview_area.topleft)
     
     def draw_info_panel(self):
         """
@@ -307,53 +586,98 @@ class GameRenderer:
         - Elapsed time (mm:ss)
         - Completion percentage (based on placed pieces)
         - Move count (total drag-and-drop operations)
+        
+        The panel is composed into one surface that is only rebuilt when
+        a displayed value changes; every frame just blits that surface.
         """
+        key = self._info_panel_state()
+        if key != self._info_panel_key:
+            self._info_panel_key = key
+            self._build_info_panel(*key)
+        
+        self.screen.blit(self._info_panel_surface, self.info_area.topleft)
+    
+    def _info_panel_state(self) -> tuple:
+        """
+        Values shown in the info panel, as a comparable key
+        
+        Returns:
+            tuple: (game mode, minutes, seconds, percentage text, moves,
+            placed pieces, total pieces)
+        """
+        # Time (integer math on whole seconds)
+        minutes, seconds = divmod(int(self.game_state.elapsed_time), 60)
+        
+        # Piece counts are maintained by GameState, no per-frame scan
+        return (
+            self.game_state.game_mode,
+            minutes,
+            seconds,
+            f"{self.game_state.completion_percentage:.0f}",
+            self.game_state.move_count,
+            self.game_state.placed_count,
+            self.game_state.total_pieces
+        )
+    
+    def _build_info_panel(self, game_mode: str, minutes: int, seconds: int,
+                          percentage: str, move_count: int, placed_pieces: int,
+                          total_pieces: int):
+        """
+        Compose the info panel surface for the given values
+        
+        Args:
+            game_mode: Game mode key
+            minutes: Elapsed minutes
+            seconds: Elapsed seconds (within the minute)
+            percentage: Completion percentage, formatted without decimals
+            move_count: Move count
+            placed_pieces: Number of placed pieces
+            total_pieces: Total number of pieces
+        """
+        panel = self._info_panel_surface
+        area = panel.get_rect()
+        
         # Info panel background (dark gray)
-        pygame.draw.rect(self.screen, (60, 70, 75), self.info_area)
-        pygame.draw.rect(self.screen, GRID_LINE_COLOR, self.info_area, 2)
+        panel.fill((60, 70, 75))
+        pygame.draw.rect(panel, GRID_LINE_COLOR, area, 2)
         
-        # Font settings - smaller for better fit
-        title_font = pygame.font.Font(None, 28)
-        info_font = pygame.font.Font(None, 24)
+        # Font sizes - smaller for better fit
+        title_size = 28
+        info_size = 24
         
         # Title
-        title = title_font.render("Statistics", True, TEXT_COLOR)
+        title = self._render_text("Statistics", title_size, TEXT_COLOR)
         title_rect = title.get_rect(
-            centerx=self.info_area.centerx,
-            top=self.info_area.y + 10
+            centerx=area.centerx,
+            top=area.y + 10
         )
-        self.screen.blit(title, title_rect)
+        panel.blit(title, title_rect)
         
         # Time
-        minutes = int(self.game_state.elapsed_time // 60)
-        seconds = int(self.game_state.elapsed_time % 60)
-        time_text = info_font.render(
-            f"Time: {minutes:02d}:{seconds:02d}", 
-            True, 
+        time_text = self._render_text(
+            f"Time: {minutes:02d}:{seconds:02d}",
+            info_size,
             TEXT_COLOR
         )
         
         # Completion percentage
-        percentage = self.game_state.completion_percentage
-        percent_text = info_font.render(
-            f"Completion: {percentage:.0f}%", 
-            True, 
+        percent_text = self._render_text(
+            f"Completion: {percentage}%",
+            info_size,
             TEXT_COLOR
         )
         
         # Move count
-        moves_text = info_font.render(
-            f"Moves: {self.game_state.move_count}", 
-            True, 
+        moves_text = self._render_text(
+            f"Moves: {move_count}",
+            info_size,
             TEXT_COLOR
         )
         
         # Total piece count
-        total_pieces = len(self.game_state.pieces)
-        placed_pieces = sum(1 for p in self.game_state.pieces if p.is_placed)
-        pieces_text = info_font.render(
-            f"Pieces: {placed_pieces}/{total_pieces}", 
-            True, 
+        pieces_text = self._render_text(
+            f"Pieces: {placed_pieces}/{total_pieces}",
+            info_size,
             TEXT_COLOR
         )
         
@@ -363,10 +687,10 @@ class GameRenderer:
             "timed": "⏱️ Time Attack",
             "challenge": "🏆 Challenge"
         }
-        mode_name = mode_names.get(self.game_state.game_mode, "🎮 Game")
-        mode_text = info_font.render(
+        mode_name = mode_names.get(game_mode, "🎮 Game")
+        mode_text = self._render_text(
             f"Mode: {mode_name}",
-            True,
+            info_size,
             TEXT_COLOR
         )
         
@@ -374,18 +698,17 @@ class GameRenderer:
         y_start = title_rect.bottom + 12
         line_spacing = 30
         
-        self.screen.blit(mode_text, (self.info_area.x + 15, y_start))
-        self.screen.blit(time_text, (self.info_area.x + 15, y_start + line_spacing))
-        self.screen.blit(percent_text, (self.info_area.x + 15, y_start + line_spacing * 2))
-        self.screen.blit(pieces_text, (self.info_area.x + 15, y_start + line_spacing * 3))
-        self.screen.blit(moves_text, (self.info_area.x + 15, y_start + line_spacing * 4))
+        panel.blit(mode_text, (15, y_start))
+        panel.blit(time_text, (15, y_start + line_spacing))
+        panel.blit(percent_text, (15, y_start + line_spacing * 2))
+        panel.blit(pieces_text, (15, y_start + line_spacing * 3))
+        panel.blit(moves_text, (15, y_start + line_spacing * 4))
         
         # Keyboard shortcuts info at bottom
-        small_font = pygame.font.Font(None, 16)
-        hint_y = self.info_area.bottom - 25
+        hint_y = area.bottom - 25
         
-        hint_text = small_font.render("ESC: Exit", True, (150, 150, 150))
-        self.screen.blit(hint_text, (self.info_area.x + 15, hint_y))
+        hint_text = self._render_text("ESC: Exit", 16, (150, 150, 150))
+        panel.blit(hint_text, (15, hint_y))
     
     def show_completion_message(self):
         """
@@ -393,91 +716,112 @@ class GameRenderer:
         
         Displays a box in the center of the screen when puzzle is completed or game fails.
         Contains statistics and new game instructions.
+        
+        The full-screen overlay is created once, and the message box is
+        composed into a surface that is only rebuilt when its content changes.
+        """
+        minutes, seconds = divmod(int(self.game_state.elapsed_time), 60)
+        key = (self.game_state.is_failed, minutes, seconds, self.game_state.move_count)
+        if key != self._completion_key:
+            self._completion_key = key
+            self._build_completion_box(*key)
+        
+        # Create semi-transparent background (once)
+        if self._completion_overlay is None:
+            self._completion_overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
+            self._completion_overlay.fill((0, 0, 0, 180))
+        self.screen.blit(self._completion_overlay, (0, 0))
+        
+        # Message box, centered on the screen
+        box_rect = self._completion_box.get_rect(
+            center=(self.screen_size[0] // 2, self.screen_size[1] // 2)
+        )
+        self.screen.blit(self._completion_box, box_rect)
+    
+    def _build_completion_box(self, is_failed: bool, minutes: int, seconds: int,
+                              move_count: int):
         """
-        # Font settings
-        title_font = pygame.font.Font(None, 84)
-        info_font = pygame.font.Font(None, 38)
-        small_font = pygame.font.Font(None, 32)
+        Compose the completion message box surface
+        
+        Args:
+            is_failed: Whether the game was lost
+            minutes: Elapsed minutes
+            seconds: Elapsed seconds (within the minute)
+            move_count: Move count
+        """
+        # Font sizes
+        title_size = 84
+        info_size = 38
+        small_size = 32
         
         # Message based on success or failure
-        if self.game_state.is_failed:
-            title_text = title_font.render("😔 Game Over!", True, (231, 76, 60))
+        if is_failed:
+            title_text = self._render_text("😔 Game Over!", title_size, (231, 76, 60))
             title_color = (231, 76, 60)
         else:
-            title_text = title_font.render("🎉 Congratulations! 🎉", True, (52, 152, 219))
+            title_text = self._render_text("🎉 Congratulations! 🎉", title_size, (52, 152, 219))
             title_color = (52, 152, 219)
         
-        minutes = int(self.game_state.elapsed_time // 60)
-        seconds = int(self.game_state.elapsed_time % 60)
-        time_text = info_font.render(
+        time_text = self._render_text(
             f"Time: {minutes:02d}:{seconds:02d}",
-            True,
+            info_size,
             (45, 52, 54)
         )
-        moves_text = info_font.render(
-            f"Moves: {self.game_state.move_count}",
-            True,
+        moves_text = self._render_text(
+            f"Moves: {move_count}",
+            info_size,
             (45, 52, 54)
         )
         
         # Separator line
-        separator_text = info_font.render("─────────────", True, (150, 150, 150))
+        separator_text = self._render_text("─────────────", info_size, (150, 150, 150))
         
-        restart_text = small_font.render(
+        restart_text = self._render_text(
             "Press 'N' for new game",
-            True,
+            small_size,
             (100, 100, 100)
         )
-        quit_text = small_font.render(
+        quit_text = self._render_text(
             "Press 'ESC' to exit",
-            True,
+            small_size,
             (100, 100, 100)
         )
         
-        # Create semi-transparent background
-        overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  
-        self.screen.blit(overlay, (0, 0))
-        
-        # Create message box
+        # Create message box (transparent outside the rounded corners)
         box_width = 600
         box_height = 400
-        center_x = self.screen_size[0] // 2
-        center_y = self.screen_size[1] // 2
-        
-        box_rect = pygame.Rect(
-            center_x - box_width // 2,
-            center_y - box_height // 2,
-            box_width,
-            box_height
-        )
+        box = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+        box_rect = box.get_rect()
+        center_x = box_width // 2
         
         # Box background (white)
-        pygame.draw.rect(self.screen, (255, 255, 255), box_rect, border_radius=15)
-        pygame.draw.rect(self.screen, title_color, box_rect, 4, border_radius=15)
+        pygame.draw.rect(box, (255, 255, 255), box_rect, border_radius=15)
+        pygame.draw.rect(box, title_color, box_rect, 4, border_radius=15)
         
         # Center and draw texts
-        y_offset = box_rect.y + 50
+        y_offset = 50
         
         title_rect = title_text.get_rect(center=(center_x, y_offset))
-        self.screen.blit(title_text, title_rect)
+        box.blit(title_text, title_rect)
         
         y_offset += 80
         time_rect = time_text.get_rect(center=(center_x, y_offset))
-        self.screen.blit(time_text, time_rect)
+        box.blit(time_text, time_rect)
         
         y_offset += 50
         moves_rect = moves_text.get_rect(center=(center_x, y_offset))
-        self.screen.blit(moves_text, moves_rect)
+        box.blit(moves_text, moves_rect)
         
         y_offset += 60
         separator_rect = separator_text.get_rect(center=(center_x, y_offset))
-        self.screen.blit(separator_text, separator_rect)
+        box.blit(separator_text, separator_rect)
         
         y_offset += 50
         restart_rect = restart_text.get_rect(center=(center_x, y_offset))
-        self.screen.blit(restart_text, restart_rect)
+        box.blit(restart_text, restart_rect)
         
         y_offset += 40
         quit_rect = quit_text.get_rect(center=(center_x, y_offset))
-        self.screen.blit(quit_text, quit_rect)
+        box.blit(quit_text, quit_rect)
+        
+        self._completion_box = box
@@ -1,13 +1,14 @@
 """Menu UI component for user selections"""
 
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, List
 from pathlib import Path
 import tkinter as tk
-from tkinter import filedialog, messagebox
+import tkinter.font as tkfont
 import os
 from jigsaw_puzzle.utils.constants import (
     GRID_OPTIONS, 
     SUPPORTED_FORMATS, 
+    SUPPORTED_FORMATS_GLOB,
     STOCK_IMAGES_DIR,
     GAME_MODE_CREATIVE,
     GAME_MODE_TIMED,
@@ -15,6 +16,150 @@ from jigsaw_puzzle.utils.constants import (
 )
 
 
+def _grid_button_text(rows: int, cols: int) -> str:
+    """
+    Build the grid selector label for a grid size
+    
+    Args:
+        rows: Grid rows
+        cols: Grid columns
+        
+    Returns:
+        Button text with piece count and difficulty level
+    """
+    total_pieces = rows * cols
+    if total_pieces <= 9:
+        difficulty = "🟢 Easy"
+    elif total_pieces <= 16:
+        difficulty = "🟡 Medium"
+    else:
+        difficulty = "🔴 Hard"
+    return f"{rows} × {cols}  ({total_pieces} pieces)\n{difficulty}"
+
+
+# Grid selector labels depend only on GRID_OPTIONS, so build them once
+_GRID_BUTTON_TEXTS = tuple(
+    (grid_size, _grid_button_text(*grid_size)) for grid_size in GRID_OPTIONS
+)
+
+
+# Single hidden Tk root shared by every menu window; creating a fresh Tk
+# interpreter per menu is the dominant cost of opening one
+_root: Optional[tk.Tk] = None
+
+
+def _get_root() -> tk.Tk:
+    """
+    Return the shared hidden Tk root, creating it on first use
+    
+    Returns:
+        Withdrawn Tk root
+    """
+    global _root
+    if _root is None:
+        _root = tk.Tk()
+        _root.withdraw()
+    return _root
+
+
+# Stock image listing cached with the folder mtime it was scanned at
+_stock_cache: Optional[Tuple[int, List[str]]] = None
+
+
+def _run_modal(window: tk.Toplevel):
+    """
+    Make a menu window modal and block until it is destroyed
+    
+    Args:
+        window: Menu window (child of the shared root)
+    """
+    window.wait_visibility()
+    window.grab_set()
+    window.focus_force()
+    window.wait_window()
+
+
+# Named fonts on the shared root, keyed by (size, style)
+_fonts: Dict[Tuple[int, str], tkfont.Font] = {}
+
+
+def _font(size: int, style: str = "normal") -> tkfont.Font:
+    """
+    Return a shared named menu font, creating it on first use
+    
+    Widgets reference the named font instead of passing a new font
+    description for Tk to parse on every widget.
+    
+    Args:
+        size: Point size
+        style: "normal", "bold" or "italic"
+        
+    Returns:
+        Named Tk font
+    """
+    key = (size, style)
+    font = _fonts.get(key)
+    if font is None:
+        font = tkfont.Font(
+            root=_get_root(),
+            family="Segoe UI",
+            size=size,
+            weight="bold" if style == "bold" else "normal",
+            slant="italic" if style == "italic" else "roman"
+        )
+        _fonts[key] = font
+    return font
+
+
+# Screen size, queried once per process for centering menu windows
+_screen_size: Optional[Tuple[int, int]] = None
+
+
+def _center_window(window: tk.Toplevel, width: int, height: int):
+    """
+    Size a menu window and center it on the screen
+    
+    Args:
+        window: Menu window
+        width: Window width
+        height: Window height
+    """
+    global _screen_size
+    if _screen_size is None:
+        root = _get_root()
+        _screen_size = (root.winfo_screenwidth(), root.winfo_screenheight())
+    screen_width, screen_height = _screen_size
+    x = (screen_width - width) // 2
+    y = (screen_height - height) // 2
+    window.geometry(f"{width}x{height}+{x}+{y}")
+
+
+def _debounced_config(widget: tk.Widget, **options):
+    """
+    Apply widget options on the next idle cycle, coalescing rapid calls
+    
+    Fast cursor sweeps over a list of buttons fire many Enter/Leave events;
+    only the last pending change per widget is applied.
+    
+    Args:
+        widget: Widget to configure
+        **options: Options passed to widget.configure()
+    """
+    root = _get_root()
+    pending = getattr(widget, '_hover_after', None)
+    if pending is not None:
+        root.after_cancel(pending)
+    
+    def apply():
+        widget._hover_after = None
+        # The menu may have closed before the idle callback ran
+        if widget.winfo_exists():
+            widget.configure(**options)
+    
+    # Scheduled on the root so the callback outlives the widget's window
+    widget._hover_after = root.after_idle(apply)
+
+
 class Menu:
     """Main menu and user selections"""
     
@@ -28,10 +173,9 @@ class Menu:
             False: Exit
         """
         try:
-            root = tk.Tk()
-            root.title("Jigsaw Puzzle Game")
-            root.geometry("600x700")
-            root.resizable(False, False)
+            window = tk.Toplevel(_get_root())
+            window.title("Jigsaw Puzzle Game")
+            window.resizable(False, False)
             
             # Modern colors - Gradient effect
             bg_color = "#0f0c29"  # Dark purple-blue
@@ -41,25 +185,22 @@ class Menu:
             button_color = "#1e3c72"  # Dark blue
             button_hover = "#2a5298"  # Medium blue
             
-            root.configure(bg=bg_color)
+            window.configure(bg=bg_color)
             
             # Center window on screen
-            root.update_idletasks()
-            x = (root.winfo_screenwidth() // 2) - (600 // 2)
-            y = (root.winfo_screenheight() // 2) - (700 // 2)
-            root.geometry(f"+{x}+{y}")
+            _center_window(window, 600, 700)
             
             # Handle window close properly
             def on_closing():
                 result[0] = False
-                root.destroy()
+                window.destroy()
             
-            root.protocol("WM_DELETE_WINDOW", on_closing)
+            window.protocol("WM_DELETE_WINDOW", on_closing)
             
             result = [False]
             
             # Main container
-            main_frame = tk.Frame(root, bg=bg_color)
+            main_frame = tk.Frame(window, bg=bg_color)
             main_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=30)
             
             # Title section
@@ -69,7 +210,7 @@ class Menu:
             title_label = tk.Label(
                 title_frame,
                 text="🧩 JIGSAW PUZZLE",
-                font=("Segoe UI", 36, "bold"),
+                font=_font(36, "bold"),
                 bg=bg_color,
                 fg=accent_color
             )
@@ -78,7 +219,7 @@ class Menu:
             subtitle_label = tk.Label(
                 title_frame,
                 text="Modern Puzzle Game",
-                font=("Segoe UI", 14, "italic"),
+                font=_font(14, "italic"),
                 bg=bg_color,
                 fg=fg_color
             )
@@ -88,7 +229,7 @@ class Menu:
             version_label = tk.Label(
                 title_frame,
                 text="v2.3",
-                font=("Segoe UI", 9),
+                font=_font(9),
                 bg=bg_color,
                 fg="#888888"
             )
@@ -102,7 +243,7 @@ class Menu:
             desc_label = tk.Label(
                 main_frame,
                 text="Select your image or use stock images\nSplit into pieces and complete the puzzle!",
-                font=("Segoe UI", 11),
+                font=_font(11),
                 bg=bg_color,
                 fg="#cccccc",
                 justify=tk.CENTER
@@ -115,18 +256,18 @@ class Menu:
             
             def on_start():
                 result[0] = True
-                root.destroy()
+                window.destroy()
             
             def on_exit():
                 result[0] = False
-                root.destroy()
+                window.destroy()
             
             def create_button(parent, text, command, bg, hover_bg, emoji=""):
                 """Creates enhanced button"""
                 btn = tk.Button(
                     parent,
                     text=f"{emoji} {text}",
-                    font=("Segoe UI", 13, "bold"),
+                    font=_font(13, "bold"),
                     bg=bg,
                     fg=fg_color,
                     activebackground=hover_bg,
@@ -140,12 +281,10 @@ class Menu:
                 )
                 
                 def on_enter(e):
-                    btn['background'] = hover_bg
-                    btn['font'] = ("Segoe UI", 13, "bold")
+                    btn.configure(background=hover_bg)
                 
                 def on_leave(e):
-                    btn['background'] = bg
-                    btn['font'] = ("Segoe UI", 13, "bold")
+                    btn.configure(background=bg)
                 
                 btn.bind("<Enter>", on_enter)
                 btn.bind("<Leave>", on_leave)
@@ -189,7 +328,7 @@ class Menu:
                 feature_label = tk.Label(
                     features_frame,
                     text=feature,
-                    font=("Segoe UI", 9),
+                    font=_font(9),
                     bg=bg_color,
                     fg="#aaaaaa",
                     anchor=tk.W
@@ -200,7 +339,7 @@ class Menu:
             info_label = tk.Label(
                 main_frame,
                 text="© 2024 Jigsaw Puzzle Game | All rights reserved",
-                font=("Segoe UI", 8),
+                font=_font(8),
                 bg=bg_color,
                 fg="#666666"
             )
@@ -213,10 +352,10 @@ class Menu:
                 elif event.keysym == 'Escape':
                     on_exit()
             
-            root.bind('<Key>', on_key)
+            window.bind('<Key>', on_key)
             
             # Show window
-            root.mainloop()
+            _run_modal(window)
             
             return result[0]
             
@@ -233,10 +372,9 @@ class Menu:
             Selected image file path (str) or None if canceled
         """
         try:
-            root = tk.Tk()
-            root.title("Image Selection")
-            root.geometry("700x600")
-            root.resizable(False, False)
+            window = tk.Toplevel(_get_root())
+            window.title("Image Selection")
+            window.resizable(False, False)
             
             # Modern colors
             bg_color = "#2c3e50"
@@ -245,21 +383,18 @@ class Menu:
             button_bg = "#34495e"
             button_hover = "#4a5f7f"
             
-            root.configure(bg=bg_color)
+            window.configure(bg=bg_color)
             
             # Center the window on the screen
-            root.update_idletasks()
-            x = (root.winfo_screenwidth() // 2) - (700 // 2)
-            y = (root.winfo_screenheight() // 2) - (600 // 2)
-            root.geometry(f"+{x}+{y}")
+            _center_window(window, 700, 600)
             
             selected_image = [None]
             
             # Title
             title_label = tk.Label(
-                root,
+                window,
                 text="🖼️ Image Selection",
-                font=("Segoe UI", 20, "bold"),
+                font=_font(20, "bold"),
                 bg=bg_color,
                 fg=fg_color,
                 pady=20
@@ -268,9 +403,9 @@ class Menu:
             
             # Description
             desc_label = tk.Label(
-                root,
+                window,
                 text="Select one of the stock images or upload your own",
-                font=("Segoe UI", 11),
+                font=_font(11),
                 bg=bg_color,
                 fg="#bdc3c7"
             )
@@ -278,9 +413,9 @@ class Menu:
             
             # Stock images section
             stock_frame = tk.LabelFrame(
-                root,
+                window,
                 text="📁 Stock Images",
-                font=("Segoe UI", 12, "bold"),
+                font=_font(12, "bold"),
                 bg=bg_color,
                 fg=fg_color,
                 bd=2,
@@ -292,56 +427,51 @@ class Menu:
             stock_images = Menu._get_stock_images()
             
             if stock_images:
-                # Scrollbar ile liste
-                canvas = tk.Canvas(stock_frame, bg=bg_color, highlightthickness=0)
-                scrollbar = tk.Scrollbar(stock_frame, orient="vertical", command=canvas.yview)
-                scrollable_frame = tk.Frame(canvas, bg=bg_color)
-                
-                scrollable_frame.bind(
-                    "<Configure>",
-                    lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+                # Listbox only draws the visible rows, unlike one Button per image
+                listbox = tk.Listbox(
+                    stock_frame,
+                    font=_font(10),
+                    bg=button_bg,
+                    fg=fg_color,
+                    selectbackground=button_hover,
+                    selectforeground=fg_color,
+                    activestyle="none",
+                    relief=tk.FLAT,
+                    bd=0,
+                    highlightthickness=0,
+                    cursor="hand2",
+                    height=12
                 )
-                
-                canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-                canvas.configure(yscrollcommand=scrollbar.set)
+                scrollbar = tk.Scrollbar(stock_frame, orient="vertical", command=listbox.yview)
+                listbox.configure(yscrollcommand=scrollbar.set)
                 
                 for img_path in stock_images:
-                    img_name = Path(img_path).name
-                    
-                    def select_stock(path=img_path):
-                        selected_image[0] = path
-                        root.destroy()
-                    
-                    btn = tk.Button(
-                        scrollable_frame,
-                        text=f"📷 {img_name}",
-                        font=("Segoe UI", 10),
-                        bg=button_bg,
-                        fg=fg_color,
-                        activebackground=button_hover,
-                        activeforeground=fg_color,
-                        relief=tk.FLAT,
-                        bd=0,
-                        width=60,
-                        height=2,
-                        cursor="hand2",
-                        anchor=tk.W,
-                        padx=20,
-                        command=select_stock
-                    )
-                    btn.pack(pady=3, padx=10, fill=tk.X)
-                    
-                    # Hover effect
-                    btn.bind("<Enter>", lambda e, b=btn: b.config(bg=button_hover))
-                    btn.bind("<Leave>", lambda e, b=btn: b.config(bg=button_bg))
+                    listbox.insert(tk.END, f"  📷 {Path(img_path).name}")
+                
+                def select_stock(event=None):
+                    selection = listbox.curselection()
+                    if selection:
+                        # Rows are inserted in stock_images order
+                        selected_image[0] = stock_images[selection[0]]
+                        window.destroy()
+                
+                def on_double_click(event):
+                    """Select only when the pointer is on a row, not the empty space below"""
+                    bbox = listbox.bbox(listbox.nearest(event.y))
+                    if bbox and bbox[1] <= event.y < bbox[1] + bbox[3]:
+                        select_stock()
+                
+                # Double click or Enter selects; a single click only highlights
+                listbox.bind("<Double-Button-1>", on_double_click)
+                listbox.bind("<Return>", select_stock)
                 
-                canvas.pack(side="left", fill="both", expand=True, padx=10, pady=10)
+                listbox.pack(side="left", fill="both", expand=True, padx=10, pady=10)
                 scrollbar.pack(side="right", fill="y")
             else:
                 no_stock_label = tk.Label(
                     stock_frame,
                     text="No stock images yet.\nYou can add images to 'assets/stock_images' folder.",
-                    font=("Segoe UI", 10),
+                    font=_font(10),
                     bg=bg_color,
                     fg="#95a5a6",
                     justify=tk.CENTER
@@ -349,12 +479,15 @@ class Menu:
                 no_stock_label.pack(pady=30)
             
             # Custom image upload button
-            custom_frame = tk.Frame(root, bg=bg_color)
+            custom_frame = tk.Frame(window, bg=bg_color)
             custom_frame.pack(pady=15)
             
             def browse_custom():
+                # Imported on first use; not needed to show the menus
+                from tkinter import filedialog
+                
                 filetypes = [
-                    ("Image files", " ".join(f"*{fmt}" for fmt in SUPPORTED_FORMATS)),
+                    ("Image files", SUPPORTED_FORMATS_GLOB),
                     ("PNG files", "*.png"),
                     ("JPEG files", "*.jpg *.jpeg"),
                     ("BMP files", "*.bmp"),
@@ -366,16 +499,16 @@ class Menu:
                     filetypes=filetypes
                 )
                 
-                if file_path:
-                    path = Path(file_path)
-                    if path.suffix.lower() in SUPPORTED_FORMATS and path.exists():
-                        selected_image[0] = str(path)
-                        root.destroy()
+                # The open dialog only returns existing files; a path that
+                # vanished meanwhile is reported by the image loader
+                if file_path and os.path.splitext(file_path)[1].lower() in SUPPORTED_FORMATS:
+                    selected_image[0] = file_path
+                    window.destroy()
             
             custom_btn = tk.Button(
                 custom_frame,
                 text="📂 Upload My Image",
-                font=("Segoe UI", 12, "bold"),
+                font=_font(12, "bold"),
                 bg="#27ae60",
                 fg=fg_color,
                 activebackground="#2ecc71",
@@ -390,14 +523,14 @@ class Menu:
             custom_btn.pack(pady=5)
             
             # Hover effect
-            custom_btn.bind("<Enter>", lambda e: custom_btn.config(bg="#2ecc71"))
-            custom_btn.bind("<Leave>", lambda e: custom_btn.config(bg="#27ae60"))
+            custom_btn.bind("<Enter>", lambda e: _debounced_config(custom_btn, bg="#2ecc71"))
+            custom_btn.bind("<Leave>", lambda e: _debounced_config(custom_btn, bg="#27ae60"))
             
             # Cancel button
             cancel_btn = tk.Button(
                 custom_frame,
                 text="✖ Cancel",
-                font=("Segoe UI", 10),
+                font=_font(10),
                 bg="#95a5a6",
                 fg=fg_color,
                 activebackground="#7f8c8d",
@@ -406,15 +539,15 @@ class Menu:
                 bd=0,
                 width=30,
                 cursor="hand2",
-                command=lambda: root.destroy()
+                command=lambda: window.destroy()
             )
             cancel_btn.pack(pady=5)
             
             # Hover effect
-            cancel_btn.bind("<Enter>", lambda e: cancel_btn.config(bg="#7f8c8d"))
-            cancel_btn.bind("<Leave>", lambda e: cancel_btn.config(bg="#95a5a6"))
+            cancel_btn.bind("<Enter>", lambda e: _debounced_config(cancel_btn, bg="#7f8c8d"))
+            cancel_btn.bind("<Leave>", lambda e: _debounced_config(cancel_btn, bg="#95a5a6"))
             
-            root.mainloop()
+            _run_modal(window)
             
             return selected_image[0]
             
@@ -430,17 +563,26 @@ class Menu:
         Returns:
             List of paths to stock images
         """
-        stock_images = []
+        global _stock_cache
+        try:
+            mtime = os.stat(STOCK_IMAGES_DIR).st_mtime_ns
+        except OSError:
+            return []
+        
+        # Folder unchanged since the last scan: reuse the cached listing
+        if _stock_cache is not None and _stock_cache[0] == mtime:
+            return list(_stock_cache[1])
         
-        if os.path.exists(STOCK_IMAGES_DIR):
-            for file in os.listdir(STOCK_IMAGES_DIR):
-                file_path = os.path.join(STOCK_IMAGES_DIR, file)
-                if os.path.isfile(file_path):
-                    ext = Path(file).suffix.lower()
-                    if ext in SUPPORTED_FORMATS:
-                        stock_images.append(file_path)
+        # scandir entries carry their file type, so no per-file stat call
+        stock_images = []
+        with os.scandir(STOCK_IMAGES_DIR) as entries:
+            for entry in entries:
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_FORMATS:
+                    stock_images.append(entry.path)
+        stock_images.sort()
         
-        return sorted(stock_images)
+        _stock_cache = (mtime, stock_images)
+        return list(stock_images)
     
     @staticmethod
     def select_game_mode() -> Optional[str]:
@@ -451,10 +593,9 @@ class Menu:
             Selected game mode (creative/timed/challenge) or None
         """
         try:
-            root = tk.Tk()
-            root.title("Game Mode Selection")
-            root.geometry("500x550")
-            root.resizable(False, False)
+            window = tk.Toplevel(_get_root())
+            window.title("Game Mode Selection")
+            window.resizable(False, False)
             
             # Modern colors
             bg_color = "#2c3e50"
@@ -462,21 +603,18 @@ class Menu:
             button_bg = "#34495e"
             button_hover = "#4a5f7f"
             
-            root.configure(bg=bg_color)
+            window.configure(bg=bg_color)
             
             # Center the window on the screen
-            root.update_idletasks()
-            x = (root.winfo_screenwidth() // 2) - (500 // 2)
-            y = (root.winfo_screenheight() // 2) - (550 // 2)
-            root.geometry(f"+{x}+{y}")
+            _center_window(window, 500, 550)
             
             selected_mode = [None]
             
             # Title
             title_label = tk.Label(
-                root,
+                window,
                 text="🎮 Game Mode Selection",
-                font=("Segoe UI", 20, "bold"),
+                font=_font(20, "bold"),
                 bg=bg_color,
                 fg=fg_color,
                 pady=25
@@ -485,16 +623,16 @@ class Menu:
             
             # Description
             desc_label = tk.Label(
-                root,
+                window,
                 text="Select the mode you want to play:",
-                font=("Segoe UI", 11),
+                font=_font(11),
                 bg=bg_color,
                 fg="#bdc3c7"
             )
             desc_label.pack(pady=(0, 20))
             
             # Mode buttons frame
-            modes_frame = tk.Frame(root, bg=bg_color)
+            modes_frame = tk.Frame(window, bg=bg_color)
             modes_frame.pack(pady=10, padx=40, fill=tk.BOTH, expand=True)
             
             def create_mode_button(mode, title, desc, emoji, color):
@@ -504,12 +642,12 @@ class Menu:
                 
                 def select_mode():
                     selected_mode[0] = mode
-                    root.destroy()
+                    window.destroy()
                 
                 btn = tk.Button(
                     frame,
                     text=f"{emoji} {title}\n{desc}",
-                    font=("Segoe UI", 11, "bold"),
+                    font=_font(11, "bold"),
                     bg=color,
                     fg=fg_color,
                     activebackground=button_hover,
@@ -562,9 +700,9 @@ class Menu:
             
             # Cancel button
             cancel_btn = tk.Button(
-                root,
+                window,
                 text="✖ Cancel",
-                font=("Segoe UI", 10),
+                font=_font(10),
                 bg="#95a5a6",
                 fg=fg_color,
                 activebackground="#7f8c8d",
@@ -573,7 +711,7 @@ class Menu:
                 bd=0,
                 width=30,
                 cursor="hand2",
-                command=lambda: root.destroy()
+                command=lambda: window.destroy()
             )
             cancel_btn.pack(pady=15)
             
@@ -581,7 +719,7 @@ class Menu:
             cancel_btn.bind("<Enter>", lambda e: cancel_btn.config(bg="#7f8c8d"))
             cancel_btn.bind("<Leave>", lambda e: cancel_btn.config(bg="#95a5a6"))
             
-            root.mainloop()
+            _run_modal(window)
             
             return selected_mode[0]
             
@@ -599,10 +737,9 @@ class Menu:
         """
         try:
             # Tkinter penceresi oluştur
-            root = tk.Tk()
-            root.title("Jigsaw Puzzle - Grid Size")
-            root.geometry("380x520")
-            root.resizable(False, False)
+            window = tk.Toplevel(_get_root())
+            window.title("Jigsaw Puzzle - Grid Size")
+            window.resizable(False, False)
             
             # Modern colors
             bg_color = "#2d3436"  # Dark gray
@@ -611,22 +748,19 @@ class Menu:
             button_bg = "#34495e"  # Medium gray
             button_hover = "#4a5f7f"  # Light gray
             
-            root.configure(bg=bg_color)
+            window.configure(bg=bg_color)
             
             # Center the window on the screen
-            root.update_idletasks()
-            x = (root.winfo_screenwidth() // 2) - (380 // 2)
-            y = (root.winfo_screenheight() // 2) - (520 // 2)
-            root.geometry(f"+{x}+{y}")
+            _center_window(window, 380, 520)
             
             # Variable to store selected grid size
             selected_grid = [None]
             
             # Title label
             title_label = tk.Label(
-                root,
+                window,
                 text="🧩 Puzzle Grid Size",
-                font=("Segoe UI", 16, "bold"),
+                font=_font(16, "bold"),
                 bg=bg_color,
                 fg=fg_color,
                 pady=20
@@ -635,9 +769,9 @@ class Menu:
             
             # Description label
             info_label = tk.Label(
-                root,
+                window,
                 text="Select difficulty level:",
-                font=("Segoe UI", 11),
+                font=_font(11),
                 bg=bg_color,
                 fg=fg_color,
                 pady=5
@@ -645,45 +779,28 @@ class Menu:
             info_label.pack()
             
             # Buttons for grid options
-            button_frame = tk.Frame(root, bg=bg_color)
+            button_frame = tk.Frame(window, bg=bg_color)
             button_frame.pack(pady=15, padx=25, fill=tk.BOTH, expand=True)
             
             def on_grid_select(grid_size: Tuple[int, int]):
                 """Called when a grid size is selected"""
                 selected_grid[0] = grid_size
-                root.quit()
-                root.destroy()
+                window.destroy()
             
             def on_enter(e, btn):
                 """Mouse hover effect"""
-                btn['background'] = button_hover
+                btn.configure(background=button_hover)
             
             def on_leave(e, btn):
                 """Mouse leave effect"""
-                btn['background'] = button_bg
+                btn.configure(background=button_bg)
             
             # Create a button for each grid option
-            for i, grid_size in enumerate(GRID_OPTIONS):
-                rows, cols = grid_size
-                total_pieces = rows * cols
-                
-                # Determine difficulty level
-                if total_pieces <= 9:
-                    difficulty = "🟢 Easy"
-                    difficulty_color = "#27ae60"
-                elif total_pieces <= 16:
-                    difficulty = "🟡 Medium"
-                    difficulty_color = "#f39c12"
-                else:
-                    difficulty = "🔴 Hard"
-                    difficulty_color = "#e74c3c"
-                
-                button_text = f"{rows} × {cols}  ({total_pieces} pieces)\n{difficulty}"
-                
+            for grid_size, button_text in _GRID_BUTTON_TEXTS:
                 btn = tk.Button(
                     button_frame,
                     text=button_text,
-                    font=("Segoe UI", 10, "bold"),
+                    font=_font(10, "bold"),
                     bg=button_bg,
                     fg=fg_color,
                     activebackground=accent_color,
@@ -703,9 +820,9 @@ class Menu:
             
             # Cancel button
             cancel_btn = tk.Button(
-                root,
+                window,
                 text="✖ Cancel",
-                font=("Segoe UI", 10),
+                font=_font(10),
                 bg="#95a5a6",
                 fg=fg_color,
                 activebackground="#7f8c8d",
@@ -714,7 +831,7 @@ class Menu:
                 bd=0,
                 width=20,
                 cursor="hand2",
-                command=lambda: root.destroy()
+                command=lambda: window.destroy()
             )
             cancel_btn.pack(pady=15)
             
@@ -723,7 +840,7 @@ class Menu:
             cancel_btn.bind("<Leave>", lambda e: cancel_btn.config(bg="#95a5a6"))
             
             # Show window and wait for user selection
-            root.mainloop()
+            _run_modal(window)
             
             return selected_grid[0]
             
@@ -731,6 +848,24 @@ class Menu:
             print(f"Grid size selector error: {e}")
             return None
     
+    @staticmethod
+    def shutdown():
+        """
+        Destroy the shared Tk root
+        
+        Call once all menus are done (before initializing Pygame, to avoid
+        SDL/Tk conflicts on macOS). A later menu call creates a new root.
+        """
+        global _root
+        if _root is not None:
+            try:
+                _root.destroy()
+            except tk.TclError:
+                pass
+            _root = None
+            # Named fonts belong to the destroyed interpreter
+            _fonts.clear()
+    
     @staticmethod
     def show_error(title: str, message: str):
         """
@@ -741,10 +876,8 @@ class Menu:
             message: Error content
         """
         try:
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showerror(title, message)
-            root.destroy()
+            from tkinter import messagebox
+            messagebox.showerror(title, message, parent=_get_root())
         except Exception as e:
             print(f"Error message could not be displayed: {e}")
             print(f"{title}: {message}")
@@ -759,10 +892,8 @@ class Menu:
             message: Message content
         """
         try:
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showinfo(title, message)
-            root.destroy()
+            from tkinter import messagebox
+            messagebox.showinfo(title, message, parent=_get_root())
         except Exception as e:
             print(f"Info message could not be displayed: {e}")
             print(f"{title}: {message}")
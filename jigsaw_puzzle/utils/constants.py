@@ -6,6 +6,7 @@ Constants and configuration settings
 SCREEN_WIDTH = 1400
 SCREEN_HEIGHT = 900
 FPS = 60
+IDLE_WAIT_MS = 100  # Max event wait per loop on the end screen
 
 # Layout ratios
 PLAY_AREA_WIDTH_RATIO = 0.65  
@@ -36,12 +37,16 @@ GRID_LINE_WIDTH = 2
 SHADOW_OFFSET = 5
 HOVER_SCALE = 1.05
 SNAP_THRESHOLD = 40  
+TEXT_CACHE_SIZE = 256  # Max rendered text surfaces kept by GameRenderer
+LOAD_REDUCING_GAP = 3.0  # Two-step resize gap for large image downscales
 
 # Animation
 SNAP_ANIMATION_DURATION = 200  
 
 # Supported image formats
-SUPPORTED_FORMATS = ['.png', '.jpg', '.jpeg', '.bmp']
+_SUPPORTED_FORMATS_ORDER = ('.png', '.jpg', '.jpeg', '.bmp')
+SUPPORTED_FORMATS = frozenset(_SUPPORTED_FORMATS_ORDER)  # Membership tests
+SUPPORTED_FORMATS_GLOB = " ".join(f"*{fmt}" for fmt in _SUPPORTED_FORMATS_ORDER)  # File dialog filter
 
 # Stock images folder
 STOCK_IMAGES_DIR = "assets/stock_images"
@@ -19,6 +19,7 @@ from jigsaw_puzzle.utils.constants import (
     SCREEN_WIDTH, 
     SCREEN_HEIGHT, 
     FPS,
+    IDLE_WAIT_MS,
     GAME_MODE_CREATIVE,
     GAME_MODE_TIMED,
     GAME_MODE_CHALLENGE
@@ -37,22 +38,17 @@ def create_jigsaw_pieces(piece_images: List[pygame.Surface],
     Returns:
         List of JigsawPiece objects
     """
-    pieces = []
     rows, cols = grid_size
-    piece_id = 0
     
-    for row in range(rows):
-        for col in range(cols):
-            position = (row, col)
-            piece = JigsawPiece(
-                image=piece_images[piece_id],
-                original_position=position,
-                piece_id=piece_id
-            )
-            pieces.append(piece)
-            piece_id += 1
-    
-    return pieces
+    # Pieces are in row-major order, so (row, col) is divmod(piece_id, cols)
+    return [
+        JigsawPiece(
+            image=piece_images[piece_id],
+            original_position=divmod(piece_id, cols),
+            piece_id=piece_id
+        )
+        for piece_id in range(rows * cols)
+    ]
 
 
 def main():
@@ -95,6 +91,9 @@ def main():
     rows, cols = grid_size
     print(f"Selected grid size: {rows}x{cols}")
     
+    # Release the shared Tk root before Pygame takes over the display
+    Menu.shutdown()
+    
     # 5. Initialize Pygame (after closing Tkinter windows)
     try:
         pygame.init()
@@ -103,6 +102,10 @@ def main():
         print(f"Pygame initialization error: {e}")
         sys.exit(1)
 
+    # Only queue the event types the game loop handles
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(GameRenderer.HANDLED_EVENT_TYPES)
+
     # 6. Create screen
     temp_screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     screen_width, screen_height = SCREEN_WIDTH, SCREEN_HEIGHT
@@ -125,10 +128,8 @@ def main():
         preview_surface = processor.pil_to_pygame(preview_pil)
         
         print("Splitting image into pieces...")
-        pil_pieces = processor.split_image(pil_image, grid_size)
-        
-        # Convert PIL pieces to pygame Surfaces
-        pygame_pieces = [processor.pil_to_pygame(piece) for piece in pil_pieces]
+        # Convert once and slice into pygame Surfaces
+        pygame_pieces = processor.split_to_pygame(pil_image, grid_size)
         
     except FileNotFoundError as e:
         print(f"File Error: {e}")
@@ -148,30 +149,21 @@ def main():
     pieces = create_jigsaw_pieces(pygame_pieces, grid_size)
     
     # 10. Initialize GameState, JigsawLogic and GameRenderer
+    # (the renderer layout also computes each piece's target position)
     print("Starting game...")
     game_state = GameState(grid_size, pieces)
     game_state.game_mode = game_mode  # Save game mode
     logic = JigsawLogic(game_state)
     renderer = GameRenderer((screen_width, screen_height), game_state, preview_surface)
     
-    # 11. Calculate correct positions for pieces and save as target_pixel_position
-    piece_width = renderer.play_area.width // cols
-    piece_height = renderer.play_area.height // rows
-    
-    for piece in pieces:
-        row, col = piece.original_position
-        target_x = renderer.play_area.x + col * piece_width
-        target_y = renderer.play_area.y + row * piece_height
-        piece.target_pixel_position = (target_x, target_y)
-    
-    # 12. Scatter pieces to PiecePool
+    # 11. Scatter pieces to PiecePool
     print("Shuffling pieces...")
     logic.scatter_pieces(renderer.piece_pool)
     
-    # 13. Start time for time tracking
-    start_time = time.time()
+    # 12. Start time for time tracking
+    start_time = time.monotonic()
     
-    # 14. Special settings based on game mode
+    # 13. Special settings based on game mode
     time_limit = None
     move_limit = None
     
@@ -187,7 +179,7 @@ def main():
         move_limit = total_pieces * 3  # 3 moves per piece
         print(f"🏆 Move limit: {move_limit} moves")
     
-    # 15. Main game loop
+    # 14. Main game loop
     clock = pygame.time.Clock()
     running = True
     
@@ -196,9 +188,16 @@ def main():
     
     while running:
         # Event handling
-        for event in pygame.event.get():
+        for event in renderer.consume_events():
+            # Mouse motion - Continue dragging (by far the most frequent
+            # event, so it is tested first)
+            if event.type == pygame.MOUSEMOTION:
+                if logic.drag_handler.dragged_piece:
+                    # Update dragged piece
+                    logic.drag_handler.update_drag(event.pos)
+            
             # Quit event
-            if event.type == pygame.QUIT:
+            elif event.type == pygame.QUIT:
                 running = False
             
             # Mouse click event - Start dragging
@@ -210,12 +209,6 @@ def main():
                         # Start dragging
                         logic.drag_handler.start_drag(piece, event.pos)
             
-            # Mouse motion - Continue dragging
-            elif event.type == pygame.MOUSEMOTION:
-                if logic.drag_handler.dragged_piece:
-                    # Update dragged piece
-                    logic.drag_handler.update_drag(event.pos)
-            
             # Mouse release event - End dragging
             elif event.type == pygame.MOUSEBUTTONUP:
                 if logic.drag_handler.dragged_piece:
@@ -232,6 +225,17 @@ def main():
                             print(f"\n🎉 Congratulations! You completed the puzzle in {game_state.move_count} moves!")
                             print(f"⏱️  Time: {int(game_state.elapsed_time // 60):02d}:{int(game_state.elapsed_time % 60):02d}")
                             print(f"📊 Completion: 100%")
+                        
+                        # Challenge mode check (moves only change here)
+                        elif move_limit and game_state.move_count >= move_limit:
+                            game_state.is_completed = True
+                            game_state.is_failed = True
+                            print(f"\n🏆 Move limit reached! Game over.")
+                            print(f"📊 Completion: {logic.get_completion_percentage():.0f}%")
+            
+            # Window uncovered - dirty-rect updates alone would leave stale areas
+            elif event.type == pygame.WINDOWEXPOSED:
+                renderer.invalidate()
             
             # Keyboard event
             elif event.type == pygame.KEYDOWN:
@@ -245,15 +249,17 @@ def main():
                     
                     # Reset all pieces
                     for piece in pieces:
-                        piece.is_placed = False
+                        game_state.mark_unplaced(piece)
                         piece.is_dragging = False
                         piece.z_index = 0
+                    game_state.draw_order[:] = pieces
                     
                     # Redistribute pieces
                     logic.scatter_pieces(renderer.piece_pool)
+                    renderer.invalidate()
                     
                     # Reset time
-                    start_time = time.time()
+                    start_time = time.monotonic()
                     
                     print("✅ New game started!")
                 
@@ -266,39 +272,38 @@ def main():
                         running = False
         
         # Time tracking
-        game_state.elapsed_time = time.time() - start_time
+        game_state.elapsed_time = time.monotonic() - start_time
         
-        # Game mode check
-        if not game_state.is_completed:
-            # Timed mode check
-            if game_mode == GAME_MODE_TIMED and time_limit:
-                if game_state.elapsed_time >= time_limit:
-                    game_state.is_completed = True
-                    game_state.is_failed = True
-                    print(f"\n⏱️  Time's up! Game over.")
-                    print(f"📊 Completion: {logic.get_completion_percentage():.0f}%")
-            
-            # Challenge mode check
-            if game_mode == GAME_MODE_CHALLENGE and move_limit:
-                if game_state.move_count >= move_limit:
-                    if not logic.is_puzzle_solved():
-                        game_state.is_completed = True
-                        game_state.is_failed = True
-                        print(f"\n🏆 Move limit reached! Game over.")
-                        print(f"📊 Completion: {logic.get_completion_percentage():.0f}%")
+        # Timed mode check (time_limit is only set in timed mode; the
+        # challenge move limit is checked when a move is made)
+        if time_limit and not game_state.is_completed:
+            if game_state.elapsed_time >= time_limit:
+                game_state.is_completed = True
+                game_state.is_failed = True
+                print(f"\n⏱️  Time's up! Game over.")
+                print(f"📊 Completion: {logic.get_completion_percentage():.0f}%")
         
         # Rendering (completion percentage automatically shown in info panel)
-        renderer.render()
-        
-        # Show completion message if game is completed
         if game_state.is_completed:
-            renderer.show_completion_message()
+            # Completion message over the game, redrawn only when it changes
+            dirty_rects = renderer.render_completion()
+        else:
+            # Only repaint the regions that changed
+            dirty_rects = renderer.render_incremental()
         
-        # Update screen
-        pygame.display.flip()
+        # Nothing changed: skip the display update entirely
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
         
-        # Limit FPS
-        clock.tick(FPS)
+        if game_state.is_completed:
+            # Nothing animates on the end screen: sleep until input arrives
+            # (or the timeout passes, so the shown time keeps updating)
+            event = pygame.event.wait(IDLE_WAIT_MS)
+            if event.type != pygame.NOEVENT:
+                pygame.event.post(event)
+        else:
+            # Limit FPS
+            clock.tick(FPS)
     
     # Cleanup
     print("\n👋 Exiting game...")
@@ -1 +1,14 @@
 # Tests package
+
+import os
+
+# No test needs a real window or sound device: use SDL's dummy drivers
+# (unless set explicitly) so no video/audio devices are probed
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# pygame is initialized once for the whole test run instead of per test
+# class; pygame registers its own quit handler at interpreter exit
+import pygame
+
+pygame.init()
@@ -12,24 +12,15 @@ class TestDragHandler(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls):
-        """Initialize pygame"""
-        pygame.init()
-    
-    @classmethod
-    def tearDownClass(cls):
-        """Quit pygame"""
-        pygame.quit()
+        """Create the piece Surfaces once (tests never draw on them)"""
+        cls.surfaces = [pygame.Surface((50, 50)) for _ in range(2)]
     
     def setUp(self):
         """Create a new DragHandler for each test"""
-        # Create simple pygame Surfaces for testing
-        surface1 = pygame.Surface((50, 50))
-        surface2 = pygame.Surface((50, 50))
-        
         # Create 2 pieces
         self.pieces = [
-            JigsawPiece(surface1, (0, 0), 0),
-            JigsawPiece(surface2, (0, 1), 1)
+            JigsawPiece(self.surfaces[0], (0, 0), 0),
+            JigsawPiece(self.surfaces[1], (0, 1), 1)
         ]
         
         # Assign initial positions to pieces
@@ -100,7 +91,7 @@ class TestDragHandler(unittest.TestCase):
         """Test snap when distance is within threshold"""
         piece = self.pieces[0]
         piece.pixel_position = (100, 100)
-        piece.target_pixel_position = (110, 110)  # ~14.14 pixels away
+        self.game_state.set_target_layout((110, 110), (50, 50))  # ~14.14 pixels away
         
         result = self.drag_handler.check_snap_to_grid(piece)
         
@@ -112,13 +103,27 @@ class TestDragHandler(unittest.TestCase):
         """Test snap when distance is outside threshold"""
         piece = self.pieces[0]
         piece.pixel_position = (100, 100)
-        piece.target_pixel_position = (200, 200)  # ~141.42 pixels away
+        self.game_state.set_target_layout((200, 200), (50, 50))  # ~141.42 pixels away
         
         result = self.drag_handler.check_snap_to_grid(piece)
         
         self.assertFalse(result)
         self.assertFalse(piece.is_placed)
     
+    def test_check_snap_to_grid_non_sequential_ids(self):
+        """Snapping works when piece ids are not 0..n-1"""
+        pieces = [
+            JigsawPiece(self.surfaces[0], (0, 0), 7),
+            JigsawPiece(self.surfaces[1], (0, 1), 99)
+        ]
+        pieces[1].pixel_position = (55, 5)
+        game_state = GameState(grid_size=(1, 2), pieces=pieces)
+        game_state.set_target_layout((0, 0), (50, 50))
+        drag_handler = DragHandler(game_state, snap_threshold=30)
+        
+        self.assertTrue(drag_handler.check_snap_to_grid(pieces[1]))
+        self.assertEqual(pieces[1].pixel_position, (50, 0))
+    
     def test_check_snap_to_grid_already_placed(self):
         """Test snap for already placed piece"""
         piece = self.pieces[0]
@@ -152,6 +157,14 @@ class TestDragHandler(unittest.TestCase):
         z2 = piece2.z_index
         
         self.assertGreater(z2, z1)
+    
+    def test_start_drag_moves_piece_to_top_of_draw_order(self):
+        """Dragged piece is drawn last"""
+        piece = self.pieces[0]
+        self.drag_handler.start_drag(piece, (100, 100))
+        
+        self.assertIs(self.game_state.draw_order[-1], piece)
+        self.assertEqual(len(self.game_state.draw_order), len(self.pieces))
 
 
 if __name__ == '__main__':
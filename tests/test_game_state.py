@@ -11,28 +11,17 @@ class TestGameState(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls):
-        """Initialize pygame"""
-        pygame.init()
-    
-    @classmethod
-    def tearDownClass(cls):
-        """Quit pygame"""
-        pygame.quit()
+        """Create the piece Surfaces once (tests never draw on them)"""
+        cls.surfaces = [pygame.Surface((50, 50)) for _ in range(4)]
     
     def setUp(self):
         """Create a new GameState for each test"""
-        # Create simple pygame Surfaces for testing
-        surface1 = pygame.Surface((50, 50))
-        surface2 = pygame.Surface((50, 50))
-        surface3 = pygame.Surface((50, 50))
-        surface4 = pygame.Surface((50, 50))
-        
         # Create 4 pieces for 2x2 grid
         self.pieces = [
-            JigsawPiece(surface1, (0, 0), 0),
-            JigsawPiece(surface2, (0, 1), 1),
-            JigsawPiece(surface3, (1, 0), 2),
-            JigsawPiece(surface4, (1, 1), 3)
+            JigsawPiece(self.surfaces[0], (0, 0), 0),
+            JigsawPiece(self.surfaces[1], (0, 1), 1),
+            JigsawPiece(self.surfaces[2], (1, 0), 2),
+            JigsawPiece(self.surfaces[3], (1, 1), 3)
         ]
         
         # Place all pieces correctly (for testing)
@@ -62,6 +51,40 @@ class TestGameState(unittest.TestCase):
         piece = self.game_state.get_piece_at((5, 5))
         self.assertIsNone(piece)
     
+    def test_get_piece_at_unplaced(self):
+        """Returns None when the piece at position is not placed"""
+        self.game_state.mark_unplaced(self.pieces[0])
+        self.assertIsNone(self.game_state.get_piece_at((0, 0)))
+    
+    def test_mark_placed(self):
+        """mark_placed sets the piece flag and restores completion"""
+        self.game_state.mark_unplaced(self.pieces[1])
+        self.assertFalse(self.pieces[1].is_placed)
+        self.assertFalse(self.game_state.check_completion())
+        
+        self.game_state.mark_placed(self.pieces[1])
+        self.assertTrue(self.pieces[1].is_placed)
+        self.assertTrue(self.game_state.check_completion())
+    
+    def test_set_target_layout(self):
+        """Targets are computed per piece_id from the grid layout"""
+        self.assertEqual(self.game_state.target_positions, {})
+        
+        self.game_state.set_target_layout((10, 20), (50, 40))
+        self.assertEqual(self.game_state.target_positions,
+                         {0: (10, 20), 1: (60, 20), 2: (10, 60), 3: (60, 60)})
+    
+    def test_set_target_layout_non_sequential_ids(self):
+        """Targets do not require piece ids to run 0..n-1"""
+        pieces = [
+            JigsawPiece(self.surfaces[0], (0, 0), 10),
+            JigsawPiece(self.surfaces[1], (0, 1), 42),
+        ]
+        game_state = GameState(grid_size=(1, 2), pieces=pieces)
+        
+        game_state.set_target_layout((0, 0), (50, 50))
+        self.assertEqual(game_state.target_positions, {10: (0, 0), 42: (50, 0)})
+    
     def test_elapsed_time(self):
         """Test elapsed time property"""
         self.assertEqual(self.game_state.elapsed_time, 0.0)
@@ -77,7 +100,7 @@ class TestGameState(unittest.TestCase):
     def test_check_completion_not_complete(self):
         """Returns False when pieces are incorrect"""
         # Mark one piece as not placed
-        self.pieces[0].is_placed = False
+        self.game_state.mark_unplaced(self.pieces[0])
         
         result = self.game_state.check_completion()
         self.assertFalse(result)
@@ -91,8 +114,8 @@ class TestGameState(unittest.TestCase):
     def test_completion_percentage_partial(self):
         """Returns correct percentage for partial placement"""
         # Mark 2 pieces as not placed
-        self.pieces[0].is_placed = False
-        self.pieces[1].is_placed = False
+        self.game_state.mark_unplaced(self.pieces[0])
+        self.game_state.mark_unplaced(self.pieces[1])
         
         percentage = self.game_state.completion_percentage
         self.assertEqual(percentage, 50.0)  # 2/4 = 50%
@@ -100,7 +123,7 @@ class TestGameState(unittest.TestCase):
     def test_completion_percentage_none_placed(self):
         """Returns 0% when no pieces are placed"""
         for piece in self.pieces:
-            piece.is_placed = False
+            self.game_state.mark_unplaced(piece)
         
         percentage = self.game_state.completion_percentage
         self.assertEqual(percentage, 0.0)
@@ -2,6 +2,8 @@
 
 import unittest
 import os
+import tempfile
+from unittest import mock
 import pygame
 from PIL import Image
 from jigsaw_puzzle.services.image_processor import ImageProcessor
@@ -12,98 +14,104 @@ class TestImageProcessor(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls):
-        """Initialize pygame and create test images"""
-        pygame.init()
+        """Create test images in a temporary directory"""
+        cls.temp_dir = tempfile.TemporaryDirectory()
         
         # Create a simple test image
-        cls.test_image_path = 'test_image.png'
-        test_img = Image.new('RGB', (400, 400), color='red')
-        test_img.save(cls.test_image_path)
-        
-        # Create images of different sizes for aspect ratio tests
-        cls.wide_image_path = 'test_wide_image.png'
-        wide_img = Image.new('RGB', (800, 400), color='blue')
-        wide_img.save(cls.wide_image_path)
-        
-        cls.tall_image_path = 'test_tall_image.png'
-        tall_img = Image.new('RGB', (400, 800), color='green')
-        tall_img.save(cls.tall_image_path)
+        cls.test_image_path = cls._save_image(
+            Image.new('RGB', (40, 40), color='red'), 'test_image.png')
+        
+        # Create images of different aspect ratios for aspect ratio tests;
+        # only the ratio matters, so they stay tiny and load_image scales
+        # them up (downscaling is covered by test_load_image_large_downscale)
+        cls.wide_image_path = cls._save_image(
+            Image.new('RGB', (80, 40), color='blue'), 'test_wide_image.png')
+        cls.tall_image_path = cls._save_image(
+            Image.new('RGB', (40, 80), color='green'), 'test_tall_image.png')
+        
+        # In-memory images shared by the split/convert/thumbnail tests
+        # (none of the functions under test modify their input)
+        cls.square_image = Image.new('RGB', (400, 400), color='blue')
+        cls.grid_image = Image.new('RGB', (600, 400), color='green')
+        cls.wide_image = Image.new('RGB', (800, 400), color='orange')
+        cls.small_image = Image.new('RGB', (100, 100), color='yellow')
+        cls.rgba_image = Image.new('RGBA', (100, 100), color=(255, 0, 0, 128))
+        
+        # Target area shared by the load_image tests (read-only, do not mutate)
+        cls.target_area = pygame.Rect(0, 0, 200, 200)
     
     @classmethod
     def tearDownClass(cls):
-        """Quit pygame and delete test images"""
-        pygame.quit()
-        for path in [cls.test_image_path, cls.wide_image_path, cls.tall_image_path]:
-            if os.path.exists(path):
-                os.remove(path)
+        """Delete test images"""
+        cls.temp_dir.cleanup()
+    
+    @classmethod
+    def _save_image(cls, image: Image.Image, name: str) -> str:
+        """Save an uncompressed PNG in the temporary directory and return its path"""
+        path = os.path.join(cls.temp_dir.name, name)
+        image.save(path, compress_level=0)
+        return path
     
     def test_load_image_success(self):
         """Image should load successfully"""
-        target_area = pygame.Rect(0, 0, 200, 200)
         grid_size = (2, 2)
-        image = ImageProcessor.load_image(self.test_image_path, target_area, grid_size)
+        image = ImageProcessor.load_image(self.test_image_path, self.target_area, grid_size)
         self.assertIsNotNone(image)
         self.assertEqual(image.size, (200, 200))
     
+    def test_load_image_cached_returns_copy(self):
+        """Repeated loads should reuse the cached image but return distinct copies"""
+        grid_size = (2, 2)
+        first = ImageProcessor.load_image(self.test_image_path, self.target_area, grid_size)
+        second = ImageProcessor.load_image(self.test_image_path, self.target_area, grid_size)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.tobytes(), second.tobytes())
+        
+        # Mutating a returned image must not affect later loads
+        first.paste((0, 0, 255), (0, 0, 200, 200))
+        third = ImageProcessor.load_image(self.test_image_path, self.target_area, grid_size)
+        self.assertEqual(third.getpixel((0, 0)), (255, 0, 0))
+    
     def test_load_image_file_not_found(self):
         """Raise FileNotFoundError for missing file"""
-        target_area = pygame.Rect(0, 0, 200, 200)
         grid_size = (2, 2)
         with self.assertRaises(FileNotFoundError):
-            ImageProcessor.load_image('nonexistent.png', target_area, grid_size)
+            ImageProcessor.load_image('nonexistent.png', self.target_area, grid_size)
     
-    def test_load_image_aspect_ratio_wide(self):
-        """For wide image, should fit the grid exactly"""
-        target_area = pygame.Rect(0, 0, 400, 400)
-        grid_size = (2, 2)
-        image = ImageProcessor.load_image(self.wide_image_path, target_area, grid_size)
-        
-        # Should fit the grid exactly (no empty space)
-        # 400x400 area, 2x2 grid -> each piece 200x200 -> total 400x400
-        self.assertEqual(image.width, 400)
-        self.assertEqual(image.height, 400)
+    def test_load_image_aspect_ratios(self):
+        """Wide, tall and square images should fit the grid exactly"""
+        # (image path, target area size, grid size); every case divides evenly,
+        # so the result must fill the whole target area with no empty space
+        cases = [
+            (self.wide_image_path, (400, 400), (2, 2)),
+            (self.tall_image_path, (400, 400), (2, 2)),
+            (self.test_image_path, (300, 300), (3, 3)),
+            (self.wide_image_path, (600, 400), (2, 3)),
+        ]
+        for path, area, grid_size in cases:
+            with self.subTest(path=os.path.basename(path), area=area, grid_size=grid_size):
+                image = ImageProcessor.load_image(path, pygame.Rect(0, 0, *area), grid_size)
+                self.assertEqual(image.size, area)
     
-    def test_load_image_aspect_ratio_tall(self):
-        """For tall image, should fit the grid exactly"""
-        target_area = pygame.Rect(0, 0, 400, 400)
-        grid_size = (2, 2)
-        image = ImageProcessor.load_image(self.tall_image_path, target_area, grid_size)
-        
-        # Should fit the grid exactly (no empty space)
-        # 400x400 area, 2x2 grid -> each piece 200x200 -> total 400x400
-        self.assertEqual(image.width, 400)
-        self.assertEqual(image.height, 400)
-    
-    def test_load_image_aspect_ratio_square(self):
-        """For square image, should fit the grid exactly"""
-        target_area = pygame.Rect(0, 0, 300, 300)
-        grid_size = (3, 3)
-        image = ImageProcessor.load_image(self.test_image_path, target_area, grid_size)
-        
-        # Should fit the grid exactly
-        # 300x300 area, 3x3 grid -> each piece 100x100 -> total 300x300
-        self.assertEqual(image.width, 300)
-        self.assertEqual(image.height, 300)
-    
-    def test_load_image_max_size_fit(self):
-        """Image should fit grid size exactly"""
-        target_area = pygame.Rect(0, 0, 600, 400)
-        grid_size = (2, 3)
-        image = ImageProcessor.load_image(self.wide_image_path, target_area, grid_size)
-        
-        # Should fit the grid exactly
-        # 600x400 area, 2x3 grid -> each piece 200x200 -> total 600x400
-        self.assertEqual(image.width, 600)
-        self.assertEqual(image.height, 400)
-        
-        # Should not exceed target area
-        self.assertLessEqual(image.width, target_area.width)
-        self.assertLessEqual(image.height, target_area.height)
+    def test_load_image_large_downscale(self):
+        """Large downscales should still fit the grid exactly"""
+        large_path = self._save_image(
+            Image.new('RGB', (2000, 1000), color='yellow'), 'test_large_image.png')
+        image = ImageProcessor.load_image(large_path, self.target_area, (2, 2))
+        self.assertEqual(image.size, (200, 200))
+        self.assertEqual(image.getpixel((100, 100)), (255, 255, 0))
+    
+    def test_load_image_large_downscale_palette(self):
+        """Large downscales of palette (P mode) images should load like RGB ones"""
+        palette_image = Image.new('RGB', (1000, 1000), color='yellow').convert('P')
+        palette_path = self._save_image(palette_image, 'test_palette_image.png')
+        image = ImageProcessor.load_image(palette_path, self.target_area, (2, 2))
+        self.assertEqual(image.size, (200, 200))
+        self.assertEqual(image.convert('RGB').getpixel((100, 100)), (255, 255, 0))
     
     def test_split_image_correct_count(self):
         """Image should split into correct number of pieces"""
-        image = Image.new('RGB', (400, 400), color='blue')
-        pieces = ImageProcessor.split_image(image, (2, 2))
+        pieces = ImageProcessor.split_image(self.square_image, (2, 2))
         
         self.assertEqual(len(pieces), 4)
         
@@ -113,8 +121,7 @@ class TestImageProcessor(unittest.TestCase):
     
     def test_split_image_different_grid(self):
         """Should work correctly for different grid sizes"""
-        image = Image.new('RGB', (600, 400), color='green')
-        pieces = ImageProcessor.split_image(image, (2, 3))
+        pieces = ImageProcessor.split_image(self.grid_image, (2, 3))
         
         self.assertEqual(len(pieces), 6)
         
@@ -122,26 +129,76 @@ class TestImageProcessor(unittest.TestCase):
         for piece in pieces:
             self.assertEqual(piece.size, (200, 200))
     
+    def test_split_image_row_major_order(self):
+        """Pieces should be returned left-to-right, top-to-bottom"""
+        # Every pixel encodes its own coordinates as (x, y, 0)
+        image = Image.new('RGB', (6, 4))
+        for y in range(4):
+            for x in range(6):
+                image.putpixel((x, y), (x, y, 0))
+        
+        pieces = ImageProcessor.split_image(image, (2, 3))
+        
+        # 2x3 grid of 2x2 pieces: piece i starts at column i % 3, row i // 3
+        self.assertEqual(
+            [piece.getpixel((0, 0)) for piece in pieces],
+            [(0, 0, 0), (2, 0, 0), (4, 0, 0), (0, 2, 0), (2, 2, 0), (4, 2, 0)]
+        )
+    
+    def test_split_surface(self):
+        """Surface should split into subsurface views of the source"""
+        surface = pygame.Surface((600, 400))
+        pieces = ImageProcessor.split_surface(surface, (2, 3))
+        
+        self.assertEqual(len(pieces), 6)
+        for piece in pieces:
+            self.assertEqual(piece.get_size(), (200, 200))
+            self.assertIs(piece.get_parent(), surface)
+        
+        # Row-major order: second piece starts at x=200, fourth at y=200
+        self.assertEqual(pieces[1].get_offset(), (200, 0))
+        self.assertEqual(pieces[3].get_offset(), (0, 200))
+    
+    def test_split_to_pygame(self):
+        """Image should split directly into pygame Surface pieces"""
+        pieces = ImageProcessor.split_to_pygame(self.grid_image, (2, 3))
+        
+        self.assertEqual(len(pieces), 6)
+        for piece in pieces:
+            self.assertIsInstance(piece, pygame.Surface)
+            self.assertEqual(piece.get_size(), (200, 200))
+    
     def test_pil_to_pygame_conversion(self):
-        """PIL Image should convert to pygame Surface"""
-        pil_image = Image.new('RGB', (100, 100), color='yellow')
-        surface = ImageProcessor.pil_to_pygame(pil_image)
+        """PIL Image should convert to pygame Surface from raw bytes (no image decode)"""
+        with mock.patch('pygame.image.load') as load:
+            surface = ImageProcessor.pil_to_pygame(self.small_image)
         
+        load.assert_not_called()
         self.assertIsInstance(surface, pygame.Surface)
         self.assertEqual(surface.get_size(), (100, 100))
     
     def test_pil_to_pygame_rgba_conversion(self):
-        """RGBA PIL Image should convert to RGB and pygame Surface"""
-        pil_image = Image.new('RGBA', (100, 100), color=(255, 0, 0, 128))
-        surface = ImageProcessor.pil_to_pygame(pil_image)
+        """RGBA PIL Image should convert to pygame Surface without dropping alpha"""
+        with mock.patch('pygame.image.load') as load:
+            surface = ImageProcessor.pil_to_pygame(self.rgba_image)
         
+        load.assert_not_called()
         self.assertIsInstance(surface, pygame.Surface)
         self.assertEqual(surface.get_size(), (100, 100))
+        self.assertTrue(surface.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(tuple(surface.get_at((0, 0))), (255, 0, 0, 128))
+    
+    def test_pil_to_pygame_palette_conversion(self):
+        """Palette PIL Image should be converted to RGB"""
+        pil_image = Image.new('RGB', (10, 10), color='red').convert('P')
+        surface = ImageProcessor.pil_to_pygame(pil_image)
+        
+        self.assertEqual(surface.get_size(), (10, 10))
+        self.assertEqual(tuple(surface.get_at((0, 0)))[:3], (255, 0, 0))
     
     def test_create_thumbnail(self):
         """Should create thumbnail"""
-        image = Image.new('RGB', (400, 400), color='purple')
-        thumbnail = ImageProcessor.create_thumbnail(image, (100, 100))
+        thumbnail = ImageProcessor.create_thumbnail(self.square_image, (100, 100))
         
         self.assertIsNotNone(thumbnail)
         # Thumbnail size should be less than or equal to requested size
@@ -150,13 +207,10 @@ class TestImageProcessor(unittest.TestCase):
     
     def test_create_thumbnail_aspect_ratio(self):
         """Thumbnail should preserve aspect ratio"""
-        image = Image.new('RGB', (800, 400), color='orange')
-        thumbnail = ImageProcessor.create_thumbnail(image, (200, 200))
+        thumbnail = ImageProcessor.create_thumbnail(self.wide_image, (200, 200))
         
-        # Orijinal aspect ratio: 2.0
-        original_ratio = 800 / 400
-        thumbnail_ratio = thumbnail.width / thumbnail.height
-        self.assertAlmostEqual(original_ratio, thumbnail_ratio, places=1)
+        # 800x400 (2:1) fitted into 200x200 -> exactly 200x100
+        self.assertEqual(thumbnail.size, (200, 100))
 
 
 if __name__ == '__main__':
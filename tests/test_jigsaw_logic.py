@@ -1,5 +1,6 @@
 """Unit tests for JigsawLogic class"""
 
+import random
 import unittest
 import pygame
 from jigsaw_puzzle.models.game_state import GameState
@@ -12,28 +13,17 @@ class TestJigsawLogic(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls):
-        """Initialize pygame"""
-        pygame.init()
-    
-    @classmethod
-    def tearDownClass(cls):
-        """Quit pygame"""
-        pygame.quit()
+        """Create the piece Surfaces once (tests never draw on them)"""
+        cls.surfaces = [pygame.Surface((50, 50)) for _ in range(4)]
     
     def setUp(self):
         """Create a new JigsawLogic for each test"""
-        # Create simple pygame Surfaces for testing
-        surface1 = pygame.Surface((50, 50))
-        surface2 = pygame.Surface((50, 50))
-        surface3 = pygame.Surface((50, 50))
-        surface4 = pygame.Surface((50, 50))
-        
         # Create 4 pieces for a 2x2 grid
         self.pieces = [
-            JigsawPiece(surface1, (0, 0), 0),
-            JigsawPiece(surface2, (0, 1), 1),
-            JigsawPiece(surface3, (1, 0), 2),
-            JigsawPiece(surface4, (1, 1), 3)
+            JigsawPiece(self.surfaces[0], (0, 0), 0),
+            JigsawPiece(self.surfaces[1], (0, 1), 1),
+            JigsawPiece(self.surfaces[2], (1, 0), 2),
+            JigsawPiece(self.surfaces[3], (1, 1), 3)
         ]
         
         self.game_state = GameState(grid_size=(2, 2), pieces=self.pieces)
@@ -83,6 +73,15 @@ class TestJigsawLogic(unittest.TestCase):
         
         self.assertIsNone(piece)
     
+    def test_get_piece_at_position_edges(self):
+        """Left/top edges are inside the piece, right/bottom edges are not"""
+        self.pieces[0].pixel_position = (100, 100)
+        
+        self.assertIs(self.logic.get_piece_at_position((100, 100)), self.pieces[0])
+        self.assertIs(self.logic.get_piece_at_position((149, 149)), self.pieces[0])
+        self.assertIsNone(self.logic.get_piece_at_position((150, 120)))
+        self.assertIsNone(self.logic.get_piece_at_position((120, 150)))
+    
     def test_get_piece_at_position_z_index_priority(self):
         """Finds the topmost piece by z-index"""
         # Place two pieces overlapping
@@ -98,50 +97,60 @@ class TestJigsawLogic(unittest.TestCase):
         # Piece with higher z-index should be selected
         self.assertEqual(piece.piece_id, 1)
     
-    def test_is_puzzle_solved_true(self):
-        """Returns True when all pieces are placed"""
-        # Place all pieces
-        for piece in self.pieces:
-            piece.is_placed = True
-        
-        result = self.logic.is_puzzle_solved()
-        self.assertTrue(result)
-    
-    def test_is_puzzle_solved_false(self):
-        """Returns False when pieces are not placed"""
-        # Do not place pieces
-        for piece in self.pieces:
-            piece.is_placed = False
+    def test_get_piece_at_position_after_drag(self):
+        """Finds the most recently dragged piece when pieces overlap"""
+        self.pieces[0].pixel_position = (100, 100)
+        self.pieces[1].pixel_position = (100, 100)
         
-        result = self.logic.is_puzzle_solved()
-        self.assertFalse(result)
-    
-    def test_get_completion_percentage_all_placed(self):
-        """Returns 100% when all pieces are placed"""
-        for piece in self.pieces:
-            piece.is_placed = True
+        self.logic.drag_handler.start_drag(self.pieces[0], (110, 110))
+        self.logic.drag_handler.end_drag()
         
-        percentage = self.logic.get_completion_percentage()
-        self.assertEqual(percentage, 100.0)
+        piece = self.logic.get_piece_at_position((110, 110))
+        self.assertIs(piece, self.pieces[0])
     
-    def test_get_completion_percentage_partial(self):
-        """Returns correct percentage for partial placement"""
-        # Place 2 pieces
-        self.pieces[0].is_placed = True
-        self.pieces[1].is_placed = True
-        self.pieces[2].is_placed = False
-        self.pieces[3].is_placed = False
-        
-        percentage = self.logic.get_completion_percentage()
-        self.assertEqual(percentage, 50.0)
+    def test_get_piece_at_position_matches_linear_scan(self):
+        """Hit-testing many overlapping pieces matches a naive topmost-Rect scan"""
+        rng = random.Random(1234)
+        rows, cols = 10, 10
+        pieces = [
+            JigsawPiece(self.surfaces[0], divmod(piece_id, cols), piece_id)
+            for piece_id in range(rows * cols)
+        ]
+        for piece in pieces:
+            piece.pixel_position = (rng.randint(0, 450), rng.randint(0, 450))
+        logic = JigsawLogic(GameState(grid_size=(rows, cols), pieces=pieces))
+        
+        # Raise pieces in random order so z-indexes differ from piece ids
+        for piece in rng.sample(pieces, len(pieces)):
+            logic.drag_handler.start_drag(piece, piece.pixel_position)
+            logic.drag_handler.end_drag()
+        
+        for _ in range(50):
+            mouse_pos = (rng.randint(0, 499), rng.randint(0, 499))
+            hits = [piece for piece in pieces
+                    if pygame.Rect(piece.pixel_position, piece.image.get_size()).collidepoint(mouse_pos)]
+            expected = max(hits, key=lambda piece: piece.z_index) if hits else None
+            with self.subTest(mouse_pos=mouse_pos):
+                self.assertIs(logic.get_piece_at_position(mouse_pos), expected)
     
-    def test_get_completion_percentage_none_placed(self):
-        """Returns 0% when no pieces are placed"""
-        for piece in self.pieces:
-            piece.is_placed = False
-        
-        percentage = self.logic.get_completion_percentage()
-        self.assertEqual(percentage, 0.0)
+    def test_completion_states(self):
+        """Solved flag and completion percentage follow the placed pieces"""
+        # (number of placed pieces, expected percentage, expected solved)
+        cases = [
+            (4, 100.0, True),
+            (2, 50.0, False),
+            (0, 0.0, False),
+        ]
+        for placed_count, percentage, solved in cases:
+            with self.subTest(placed_count=placed_count):
+                for index, piece in enumerate(self.pieces):
+                    if index < placed_count:
+                        self.game_state.mark_placed(piece)
+                    else:
+                        self.game_state.mark_unplaced(piece)
+                
+                self.assertEqual(self.logic.get_completion_percentage(), percentage)
+                self.assertEqual(self.logic.is_puzzle_solved(), solved)
 
 
 if __name__ == '__main__':
@@ -9,21 +9,13 @@ class TestJigsawPiece(unittest.TestCase):
     """Unit tests for JigsawPiece class"""
     
     @classmethod
-    def setUpClass(cls):
-        """Initialize pygame"""
-        pygame.init()
-    
-    @classmethod
-    def tearDownClass(cls):
-        """Quit pygame"""
-        pygame.quit()
+    def setUpClass(cls):
+        """Create the piece Surface once (tests never draw on it)"""
+        cls.test_surface = pygame.Surface((100, 100))
+        cls.test_surface.fill((255, 0, 0))
     
     def setUp(self):
         """Create a new JigsawPiece for each test"""
-        # Basit bir pygame Surface oluştur
-        self.test_surface = pygame.Surface((100, 100))
-        self.test_surface.fill((255, 0, 0))
-        
         self.piece = JigsawPiece(
             image=self.test_surface,
             original_position=(0, 0),
@@ -39,6 +31,7 @@ class TestJigsawPiece(unittest.TestCase):
         self.assertFalse(self.piece.is_placed)
         self.assertEqual(self.piece.z_index, 0)
         self.assertIsNotNone(self.piece.image)
+        self.assertEqual((self.piece.width, self.piece.height), (100, 100))
     
     def test_is_in_correct_position_true(self):
         """Returns True when piece is placed"""
@@ -61,6 +54,15 @@ class TestJigsawPiece(unittest.TestCase):
         distance = self.piece.distance_to_correct_position((3, 4))
         self.assertEqual(distance, 5.0)  # 3-4-5 triangle
     
+    def test_distance_sq_to(self):
+        """Squared distance avoids the square root"""
+        self.piece.pixel_position = (0, 0)
+        self.assertEqual(self.piece.distance_sq_to((3, 4)), 25)
+    
+    def test_distance_sq_to_no_pixel_position(self):
+        """Squared distance is infinity when pixel_position is None"""
+        self.assertEqual(self.piece.distance_sq_to((3, 4)), float('inf'))
+    
     def test_dragging_state(self):
         """Dragging state can be toggled"""
         self.assertFalse(self.piece.is_dragging)